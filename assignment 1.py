@@ -1,705 +1,3709 @@
-print("Name - Piyush Kushwaha")
-print("Enrollment no. - 0157CY231079")
-print("Batch - 5")
-print("Batch time - 10:30\n")
-print("question numbers range is from 1 to 40")
-question_no = int(input("enter question no."))
-#1. Write a program to check whether a number is positive, negative, or zero.
-if(question_no == 1):
-    print("check for +ve,-ve or zero")
-    c = int(input("enter no."))
+# the file can be imported as a library: nothing runs at import time but
+# these imports and some constants. heavier modules (json, csv, argparse,
+# random, re, threading, queue, decimal, fractions, concurrent.futures) are
+# imported inside the functions that use them, and the bigger tables are
+# built on first use, so an import stays cheap.
+import sys
+import os
+import mmap
+import math
+import bisect
+import time
+import contextlib
+import itertools
+import functools
+import heapq
+import collections
+from array import array
+
+
+# ---------------------------------------------------------------------------
+# process pool helper
+# ---------------------------------------------------------------------------
+
+# like executor.map(fn, tasks) but keeps at most `window` tasks in flight,
+# so a long task list (or big results) never piles up in memory. results
+# come back in task order, or as they finish when ordered is false. when
+# the caller stops early, the tasks that have not started are cancelled.
+def bounded_map(fn, tasks, workers=None, window=None, ordered=True):
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    workers = workers or os.cpu_count() or 1
+    window = window or 2 * workers
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = collections.deque()
+        for task in tasks:
+            pending.append(executor.submit(fn, *task))
+            while len(pending) >= window:
+                if ordered:
+                    yield pending.popleft().result()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        yield future.result()
+        while pending:
+            if ordered:
+                yield pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield future.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+# ---------------------------------------------------------------------------
+# memory-mapped input files
+# ---------------------------------------------------------------------------
+
+text_chunk_size = 1 << 20
+
+
+# the whole file as a read-only mmap (b"" for an empty file, which mmap
+# cannot map)
+@contextlib.contextmanager
+def mapped_file(path):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+
+def mapped_chunks(path, chunk_size=None):
+    chunk_size = chunk_size or text_chunk_size
+    with mapped_file(path) as mm:
+        for start in range(0, len(mm), chunk_size):
+            yield mm[start:start + chunk_size]
+
+
+# one JSON value per line, as the command-line modes report their results
+def write_json_line(value, stream=None):
+    import json
+    (stream or sys.stdout).write(json.dumps(value) + "\n")
+
+
+# the lines of a file as bytes, without their line endings
+def mapped_lines(path):
+    parts = []      # pieces of a line that runs across chunks
+    for chunk in mapped_chunks(path):
+        lines = chunk.split(b"\n")
+        if len(lines) == 1:
+            parts.append(chunk)
+            continue
+        parts.append(lines[0])
+        lines[0] = b"".join(parts)
+        parts = [lines.pop()]
+        for line in lines:
+            yield line.rstrip(b"\r")
+    rest = b"".join(parts)
+    if rest:
+        yield rest.rstrip(b"\r")
+
+
+# ---------------------------------------------------------------------------
+# prime engine: segmented Sieve of Eratosthenes over odd numbers. Every
+# segment is a bytearray with one byte per odd number, so memory stays
+# bounded by the segment size no matter how far the primes go.
+# ---------------------------------------------------------------------------
+
+sieve_segment_size = 1 << 18    # odd numbers per segment
+
+
+# all primes <= limit (plain sieve, used for the base primes of the segments)
+def simple_sieve(limit):
+    if limit < 2:
+        return []
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0] = sieve[1] = 0
+    for i in range(2, math.isqrt(limit) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = bytes(len(range(i*i, limit + 1, i)))
+    return list(itertools.compress(range(limit + 1), sieve))
+
+
+# flags for the odd numbers lo, lo+2, ... below hi (lo odd); base_primes are
+# the odd primes up to at least sqrt(hi)
+def sieve_segment(lo, hi, base_primes):
+    size = (hi - lo + 1) // 2
+    flags = bytearray([1]) * size
+    for p in base_primes:
+        if p * p >= hi:
+            break
+        start = max(p * p, (lo + p - 1) // p * p)
+        if start % 2 == 0:
+            start += p
+        first = (start - lo) // 2
+        flags[first::p] = bytes(len(range(first, size, p)))
+    return flags
+
+
+# yields (lo, flags) segments covering the odd numbers from lo up to hi
+# (exclusive), or forever when hi is None
+def prime_segments(lo, hi=None, segment_size=None):
+    segment_size = segment_size or sieve_segment_size
+    lo = max(lo, 3) | 1
+    base_limit = 0
+    base = []
+    while hi is None or lo < hi:
+        seg_hi = lo + 2 * segment_size
+        if hi is not None:
+            seg_hi = min(seg_hi, hi)
+        root = math.isqrt(seg_hi)
+        if root > base_limit:
+            base_limit = max(root, 2 * base_limit)
+            base = simple_sieve(base_limit)[1:]
+        yield lo, sieve_segment(lo, seg_hi, base)
+        lo = seg_hi | 1
+
+
+# every prime in increasing order, without an upper bound
+def iter_primes():
+    yield 2
+    for lo, flags in prime_segments(3):
+        yield from itertools.compress(itertools.count(lo, 2), flags)
+
+
+# primes p with a <= p <= b
+def primes_between(a, b):
+    a = int(a)
+    b = int(b)
+    if a <= 2 <= b:
+        yield 2
+    for lo, flags in prime_segments(a, b + 1):
+        yield from itertools.compress(itertools.count(lo, 2), flags)
+
+
+# ---------------------------------------------------------------------------
+# twin primes: the range is cut into chunks of twin_chunk_size numbers and
+# every chunk is sieved in a worker process. a chunk only sends back its own
+# pairs (or just their count), so the full list is never held anywhere.
+# ---------------------------------------------------------------------------
+
+twin_chunk_size = 1 << 24
+
+
+# twin pairs (p, p+2) with lo <= p < hi and p+2 <= b. returns the list of p,
+# or only how many there are when count_only is set
+def twin_primes_chunk(lo, hi, b, count_only=False):
+    start = max(lo, 3) | 1
+    top = min(hi + 2, b + 1)
+    if start + 2 >= top:
+        return 0 if count_only else []
+    flags = sieve_segment(start, top, simple_sieve(math.isqrt(top))[1:])
+    # byte i of pairs is 1 when start+2i and start+2i+2 are both prime
+    x = int.from_bytes(flags, "little")
+    pairs = (x & (x >> 8)).to_bytes(len(flags), "little")[:(hi - start + 1) // 2]
+    if count_only:
+        return pairs.count(1)
+    return list(itertools.compress(itertools.count(start, 2), pairs))
+
+
+# twin pairs with both members in [a, b], in increasing order (a range
+# scan of p over [a, b - 2])
+def twin_primes_between(a, b, workers=None):
+    for p in scan_matches(twin_kernel, int(a), int(b) - 2, workers=workers, chunk_size=twin_chunk_size):
+        yield (p, p + 2)
+
+
+def count_twin_primes(a, b, workers=None):
+    return scan_count(twin_kernel, int(a), int(b) - 2, workers=workers, chunk_size=twin_chunk_size)
+
+
+# ---------------------------------------------------------------------------
+# digit multiset search, shared by the narcissistic (question 21) and
+# factorion (question 30) engines. both look for numbers with `length`
+# digits in base `base` that equal the sum of values[d] over their digits
+# d. only the multiset of digits matters for that sum, so instead of
+# scanning every integer we pick how many of each digit (largest first) to
+# use and check the sum once per multiset. branches are cut when the
+# possible sums leave the `length`-digit range, or when the leading digits
+# that every possible sum shares are not available.
+# ---------------------------------------------------------------------------
+
+def to_digits(n, base=10):
+    if base == 10:
+        return [int(c) for c in str(n)]
+    digits = []
+    while n:
+        n, d = divmod(n, base)
+        digits.append(d)
+    return digits[::-1] or [0]
+
+
+def digit_multiset_search(values, base, length):
+    lo = base ** (length - 1) if length > 1 else 1
+    hi = base ** length - 1
+    counts = [0] * base
+    found = []
+
+    def search(digit, remaining, total):
+        if digit == 0 or remaining == 0:
+            counts[digit] = remaining
+            total += remaining * values[digit]
+            if lo <= total <= hi:
+                have = [0] * base
+                for d in to_digits(total, base):
+                    have[d] += 1
+                if have == counts:
+                    found.append(total)
+            counts[digit] = 0
+            return
+        largest = total + remaining * values[digit]
+        if largest < lo or total > hi:
+            return
+        need = [0] * base
+        for x, y in zip(to_digits(max(total, lo), base), to_digits(min(largest, hi), base)):
+            if x != y:
+                break
+            need[x] += 1
+        if any(need[d] > counts[d] for d in range(digit + 1, base)):
+            return
+        if sum(need[:digit + 1]) > remaining:
+            return
+        for c in range(remaining, -1, -1):
+            counts[digit] = c
+            search(digit - 1, remaining - c, total + c * values[digit])
+        counts[digit] = 0
+
+    search(base - 1, length, 0)
+    return sorted(found)
+
+
+# ---------------------------------------------------------------------------
+# narcissistic (Armstrong) numbers: a number with L digits whose digits'
+# L-th powers add up to the number itself.
+# ---------------------------------------------------------------------------
+
+max_narcissistic_length = 39    # no narcissistic number has more digits
+
+
+def narcissistic_of_length(length):
+    return digit_multiset_search([d ** length for d in range(10)], 10, length)
+
+
+# narcissistic numbers for every digit length in [min_length, max_length],
+# one length per worker process
+def narcissistic_numbers(min_length=1, max_length=max_narcissistic_length, workers=None):
+    lengths = range(int(min_length), int(max_length) + 1)
+    if len(lengths) <= 1 or workers == 1:
+        results = map(narcissistic_of_length, lengths)
+    else:
+        results = bounded_map(narcissistic_of_length, ((length,) for length in lengths), workers)
+    for found in results:
+        yield from found
+
+
+# ---------------------------------------------------------------------------
+# Collatz engine. stopping_time(n) is the number of steps from n down to 1.
+# small starts are answered from an array built once on first use; larger
+# ones walk down until they land in the array, and their results are kept
+# in a bounded LRU cache.
+# ---------------------------------------------------------------------------
+
+collatz_table_size = 1 << 20
+collatz_cache_size = 1 << 16
+collatz_chunk_size = 1 << 20
+collatz_table = None
+collatz_cache = collections.OrderedDict()
+
+
+def collatz_trajectory(n):
+    n = int(n)
+    if n < 1:
+        raise ValueError("Collatz sequence needs a positive starting number.")
+    yield n
+    while n != 1:
+        if n % 2 == 0:
+            n //= 2
+        else:
+            n = 3 * n + 1
+        yield n
+
+
+# stopping times of lo..hi-1. `known` answers every start below `below`;
+# a walk also stops as soon as it drops into the part of the chunk that is
+# already done. an odd step goes straight to (3n+1)/2, which counts as two.
+def collatz_chunk_times(lo, hi, known, below):
+    times = array("H", bytes(2 * (hi - lo)))
+    for n in range(lo, hi):
+        m = n
+        steps = 0
+        while True:
+            if m < below:
+                steps += known[m]
+                break
+            if lo <= m < n:
+                steps += times[m - lo]
+                break
+            if m & 1:
+                m = (3 * m + 1) >> 1
+                steps += 2
+            else:
+                m >>= 1
+                steps += 1
+        times[n - lo] = steps
+    return times
+
+
+def get_collatz_table():
+    global collatz_table
+    if collatz_table is None:
+        # 0 is not a valid start; it gets 0 steps just to fill the slot
+        known = array("H", [0, 0])
+        collatz_table = known + collatz_chunk_times(2, collatz_table_size, known, 2)
+    return collatz_table
+
+
+def stopping_time(n):
+    n = int(n)
+    if n < 1:
+        raise ValueError("Collatz sequence needs a positive starting number.")
+    table = get_collatz_table()
+    if n < len(table):
+        return table[n]
+    if n in collatz_cache:
+        collatz_cache.move_to_end(n)
+        return collatz_cache[n]
+    m = n
+    steps = 0
+    while m >= len(table):
+        if m & 1:
+            m = (3 * m + 1) >> 1
+            steps += 2
+        else:
+            m >>= 1
+            steps += 1
+    steps += table[m]
+    collatz_cache[n] = steps
+    if len(collatz_cache) > collatz_cache_size:
+        collatz_cache.popitem(last=False)
+    return steps
+
+
+# worker for collatz_range: (lo, stopping times of lo..hi-1, longest start)
+def collatz_range_chunk(lo, hi):
+    table = get_collatz_table()
+    times = collatz_chunk_times(lo, hi, table, len(table))
+    best = max(range(len(times)), key=times.__getitem__)
+    return lo, times, lo + best
+
+
+# stopping times for every start in [1, N], streamed one chunk at a time as
+# (lo, array of stopping times, start with the longest chain in the chunk).
+# chunks are spread over worker processes.
+def collatz_range(N, workers=None):
+    N = int(N)
+    chunks = [(lo, min(lo + collatz_chunk_size, N + 1)) for lo in range(1, N + 1, collatz_chunk_size)]
+    if len(chunks) <= 1 or workers == 1:
+        return itertools.starmap(collatz_range_chunk, chunks)
+    return bounded_map(collatz_range_chunk, chunks, workers)
+
+
+# start in [1, N] with the longest chain, and its stopping time
+def longest_collatz(N, workers=None):
+    best, best_steps = 1, 0
+    for lo, times, start in collatz_range(N, workers):
+        if times[start - lo] > best_steps:
+            best, best_steps = start, times[start - lo]
+    return best, best_steps
+
+
+# ---------------------------------------------------------------------------
+# Pascal's triangle. rows are made from the previous row only, so memory is
+# one row however many rows are printed. with a prime modulus p, single
+# entries come from Lucas' theorem and never touch the earlier rows.
+# ---------------------------------------------------------------------------
+
+# C(n, k) mod p for a prime p and n < p
+def comb_mod_prime(n, k, p):
+    k = min(k, n - k)
+    numerator = denominator = 1
+    for i in range(k):
+        numerator = numerator * (n - i) % p
+        denominator = denominator * (i + 1) % p
+    return numerator * pow(denominator, -1, p) % p
+
+
+# C(n, k), or C(n, k) mod `mod`
+def pascal_entry(n, k, mod=None):
+    if k < 0 or k > n:
+        return 0
+    if not mod:
+        return math.comb(n, k)
+    if not is_probable_prime(mod):
+        return math.comb(n, k) % mod
+    # Lucas: multiply the binomials of the base-p digits of n and k
+    result = 1
+    while n and result:
+        n, ni = divmod(n, mod)
+        k, ki = divmod(k, mod)
+        result = 0 if ki > ni else result * comb_mod_prime(ni, ki, mod) % mod
+    return result
+
+
+# row n (counting from 0) on its own, without the rows above it
+def pascal_row(n, mod=None):
+    if mod:
+        return [pascal_entry(n, k, mod) for k in range(n + 1)]
+    row = [1]
+    for k in range(n):
+        row.append(row[-1] * (n - k) // (k + 1))
+    return row
+
+
+def pascal_rows(n, mod=None):
+    row = []
+    for i in range(n):
+        row = [1] + [a + b for a, b in zip(row, row[1:])] + ([1] if i else [])
+        if mod:
+            row = [x % mod for x in row]
+        yield row
+
+
+# prints the rows centred like the original triangle through one buffered
+# writer
+def write_pascal_rows(n, mod=None, out=None):
+    out = out or sys.stdout
+    buffer = []
+    for row in pascal_rows(n, mod):
+        buffer.append(" ".join(map(str, row)).center(n * 3))
+        if len(buffer) >= 256:
+            out.write("\n".join(buffer) + "\n")
+            buffer.clear()
+    if buffer:
+        out.write("\n".join(buffer) + "\n")
+    out.flush()
+
+
+# ---------------------------------------------------------------------------
+# factorization: trial division by the primes below 1000 first, then
+# Miller-Rabin to spot primes and Pollard-Brent rho to split what is left.
+# full factorizations are kept in a bounded LRU cache.
+# ---------------------------------------------------------------------------
+
+small_primes = None
+factor_cache_size = 1 << 16
+factor_cache = collections.OrderedDict()
+factor_batch_size = 64
+
+# with these bases Miller-Rabin is exact for every n < 3.3 * 10**24
+miller_rabin_bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+miller_rabin_rounds = 20    # random extra bases above that
+
+
+def get_small_primes():
+    global small_primes
+    if small_primes is None:
+        small_primes = simple_sieve(1000)
+    return small_primes
+
+
+def is_probable_prime(n):
+    if n < 2:
+        return False
+    for p in get_small_primes():
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    r = 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    bases = miller_rabin_bases
+    if n >= 3317044064679887385961981:
+        import random
+        bases += tuple(random.randrange(2, n - 1) for _ in range(miller_rabin_rounds))
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+# some non-trivial factor of an odd composite n
+def pollard_brent(n):
+    import random
+    while True:
+        y = random.randrange(1, n)
+        c = random.randrange(1, n)
+        m = 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # the batched gcd overshot; redo the last block one step at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+# prime factors of n (n >= 1) in increasing order, with repeats
+def factorize(n):
+    n = int(n)
+    if n < 1:
+        raise ValueError("Only positive integers can be factorized.")
+    if n in factor_cache:
+        factor_cache.move_to_end(n)
+        return list(factor_cache[n])
+    factors = []
+    rest = n
+    for p in get_small_primes():
+        if p * p > rest:
+            break
+        while rest % p == 0:
+            factors.append(p)
+            rest //= p
+    stack = [rest] if rest > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_probable_prime(m):
+            factors.append(m)
+        else:
+            d = pollard_brent(m)
+            stack += [d, m // d]
+    factors.sort()
+    cache_factors(n, factors)
+    return factors
+
+
+# stores a factorization in factor_cache, dropping the least recently used
+# entries once the cache is full
+def cache_factors(n, factors):
+    factor_cache[n] = tuple(factors)
+    factor_cache.move_to_end(n)
+    while len(factor_cache) > factor_cache_size:
+        factor_cache.popitem(last=False)
+
+
+def factorize_list(numbers):
+    return [factorize(n) for n in numbers]
+
+
+# factorizations of many numbers, in order, spread over worker processes.
+# repeated inputs are only factorized once.
+def factorize_many(numbers, workers=None):
+    numbers = [int(n) for n in numbers]
+    todo = [n for n in dict.fromkeys(numbers) if n not in factor_cache]
+    batches = [(todo[i:i + factor_batch_size],) for i in range(0, len(todo), factor_batch_size)]
+    if len(batches) <= 1 or workers == 1:
+        results = itertools.starmap(factorize_list, batches)
+    else:
+        results = bounded_map(factorize_list, batches, workers)
+    done = {}
+    for (batch,), factors in zip(batches, results):
+        done.update(zip(batch, factors))
+    # the workers' caches die with them; keep their answers in this one
+    for n, factors in done.items():
+        cache_factors(n, factors)
+    return [done[n] if n in done else factorize(n) for n in numbers]
+
+
+# ---------------------------------------------------------------------------
+# Kaprekar numbers. splitting n*n into a*10**m + b with a + b == n means
+# (10**m - 1) divides n*(n - 1), and b > 0 forces n < 10**m. so for every m
+# the candidates are the residues that are 0 modulo some of the prime powers
+# of 10**m - 1 and 1 modulo the others (one per unitary divisor), which
+# CRT gives directly instead of testing every n.
+# ---------------------------------------------------------------------------
+
+powers_of_10 = [10 ** i for i in range(40)]
+# 10**43 - 1 has prime factors of 16 and 19 digits, too big for Pollard's rho
+kaprekar_max_digits = 21
+
+
+def power_of_10(m):
+    while m >= len(powers_of_10):
+        powers_of_10.append(powers_of_10[-1] * 10)
+    return powers_of_10[m]
+
+
+# the d-th cyclotomic polynomial at 10. 10**m - 1 is the product of these
+# over the divisors d of m, and factoring them one at a time keeps large
+# primes of different pieces apart (10**38 - 1 = 99 * R19 * 909090909090909091,
+# which Pollard's rho cannot split in one go).
+@functools.lru_cache(maxsize=None)
+def cyclotomic_at_10(d):
+    value = power_of_10(d) - 1
+    for e in range(1, d // 2 + 1):
+        if d % e == 0:
+            value //= cyclotomic_at_10(e)
+    return value
+
+
+# the prime factors of 10**m - 1
+def factorize_nines(m):
+    factors = []
+    for d in range(1, m + 1):
+        if m % d == 0:
+            factors += factorize(cyclotomic_at_10(d))
+    return sorted(factors)
+
+
+# n with a split of n*n whose right part has exactly m digits
+def kaprekar_with_split(m):
+    modulus = power_of_10(m) - 1
+    prime_powers = [p ** e for p, e in collections.Counter(factorize_nines(m)).items()]
+    found = set()
+    for picks in itertools.product((False, True), repeat=len(prime_powers)):
+        d = math.prod(q for q, pick in zip(prime_powers, picks) if pick)
+        e = modulus // d
+        # n = 0 (mod d) and n = 1 (mod e)
+        n = d * pow(d, -1, e) % modulus if e > 1 else modulus
+        if n > 1 and n * (n - 1) >= modulus:
+            found.add(n)
+    return found
+
+
+# every Kaprekar number below 10**k with at least min_digits digits. such
+# an n is below 10**m for its split m, so m runs from min_digits to 2*k.
+def kaprekar_numbers(k, min_digits=1):
+    k = int(k)
+    if k > kaprekar_max_digits:
+        raise ValueError(f"Kaprekar numbers can only be searched up to {kaprekar_max_digits} digits.")
+    limit = power_of_10(k)
+    low = power_of_10(min_digits - 1) if min_digits > 1 else 0
+    found = set()
+    for m in range(min_digits, 2 * k + 1):
+        found.update(n for n in kaprekar_with_split(m) if low <= n < limit)
+    return sorted(found)
+
+
+# ---------------------------------------------------------------------------
+# digit DP: counts (and lists) the numbers whose digit sum lies in
+# [min_sum, max_sum] and that are divisible by `modulus`, without looking at
+# every number. table[L][t] holds, for every remainder r, how many L-digit
+# strings have digit sum t and are r modulo `modulus`. the counts for all
+# remainders are packed into one int, `bits` bits per remainder, so adding a
+# digit in front is a rotation of that int and runs at C speed.
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=256)
+def digit_count_table(modulus, max_sum, length):
+    bits = 4 * length + 4             # room for counts up to 10**length
+    full = (1 << (modulus * bits)) - 1
+    table = [[1]]                     # the empty string: sum 0, remainder 0
+    for L in range(length):
+        prev = table[-1]
+        shift = pow(10, L, modulus)
+        row = []
+        for t in range(min(max_sum, 9 * (L + 1)) + 1):
+            total = 0
+            for d in range(max(0, t - len(prev) + 1), min(9, t) + 1):
+                x = prev[t - d]
+                k = d * shift % modulus
+                if k:
+                    x = ((x << (k * bits)) & full) | (x >> ((modulus - k) * bits))
+                total += x
+            row.append(total)
+        table.append(row)
+    return bits, table
+
+
+# how many numbers prefix*10**L + x (0 <= x < 10**L) qualify, given the
+# digit sum of the prefix
+def digit_subtree_count(table, bits, L, prefix, prefix_sum, modulus, min_sum, max_sum):
+    row = table[L]
+    need = -prefix * pow(10, L, modulus) % modulus
+    mask = (1 << bits) - 1
+    total = 0
+    for t in range(max(min_sum - prefix_sum, 0), min(max_sum - prefix_sum, len(row) - 1) + 1):
+        total += (row[t] >> (need * bits)) & mask
+    return total
+
+
+# numbers in [0, N] with min_sum <= digit sum <= max_sum and n % modulus == 0
+def count_digit_numbers(N, modulus=1, min_sum=0, max_sum=None):
+    N = int(N)
+    if N < 0:
+        return 0
+    digits = [int(c) for c in str(N)]
+    if max_sum is None:
+        max_sum = 9 * len(digits)
+    bits, table = digit_count_table(modulus, max_sum, len(digits))
+    total = 0
+    prefix = prefix_sum = 0
+    for i, D in enumerate(digits):
+        L = len(digits) - i - 1
+        for d in range(min(D, max_sum - prefix_sum + 1)):
+            total += digit_subtree_count(table, bits, L, prefix * 10 + d, prefix_sum + d, modulus, min_sum, max_sum)
+        prefix = prefix * 10 + D
+        prefix_sum += D
+        if prefix_sum > max_sum:
+            return total
+    if prefix_sum >= min_sum and N % modulus == 0:
+        total += 1
+    return total
+
+
+def count_digit_numbers_between(a, b, modulus=1, min_sum=0, max_sum=None):
+    return count_digit_numbers(b, modulus, min_sum, max_sum) - count_digit_numbers(int(a) - 1, modulus, min_sum, max_sum)
+
+
+# the same numbers in increasing order, restricted to [a, b]. subtrees with
+# no match are skipped using the table, so this is lazy and cheap even when
+# matches are rare.
+def iter_digit_numbers(a, b, modulus=1, min_sum=0, max_sum=None):
+    a = max(int(a), 0)
+    b = int(b)
+    if b < a:
+        return
+    width = len(str(b))
+    if max_sum is None:
+        max_sum = 9 * width
+    bits, table = digit_count_table(modulus, max_sum, width)
+
+    def walk(prefix, prefix_sum, L):
+        lo = prefix * power_of_10(L)
+        hi = lo + power_of_10(L) - 1
+        if hi < a or lo > b:
+            return
+        if not digit_subtree_count(table, bits, L, prefix, prefix_sum, modulus, min_sum, max_sum):
+            return
+        if L == 0:
+            yield prefix
+            return
+        for d in range(min(9, max_sum - prefix_sum) + 1):
+            yield from walk(prefix * 10 + d, prefix_sum + d, L - 1)
+
+    yield from walk(0, 0, width)
+
+
+# Harshad numbers: split by digit sum s, each is a digit DP with modulus s
+def count_harshad(N):
+    N = int(N)
+    return sum(count_digit_numbers(N, s, s, s) for s in range(1, 9 * len(str(max(N, 1))) + 1))
+
+
+def iter_harshad(a, b):
+    b = int(b)
+    return heapq.merge(*(iter_digit_numbers(max(int(a), 1), b, s, s, s) for s in range(1, 9 * len(str(max(b, 1))) + 1)))
+
+
+# the per-number loops the engine replaced; kept to cross-check it
+def digit_numbers_loop(a, b, modulus=1, min_sum=0, max_sum=None):
+    found = []
+    for num in range(max(int(a), 0), int(b) + 1):
+        if num % modulus == 0:
+            sum_of_digits = sum(int(digit) for digit in str(num))
+            if sum_of_digits >= min_sum and (max_sum is None or sum_of_digits <= max_sum):
+                found.append(num)
+    return found
+
+
+def harshad_loop(a, b):
+    return [num for num in range(max(int(a), 1), int(b) + 1) if num % sum(int(digit) for digit in str(num)) == 0]
+
+
+# ---------------------------------------------------------------------------
+# happy numbers. one step takes any n to at most 81 * (number of digits),
+# so happiness is looked up in a table of small values after the first
+# step. digit-square sums are taken 4 digits at a time from a 10,000-entry
+# table. ranges come out as one flag byte per number, built a 10,000-number
+# block at a time: the flags of a block depend only on the square sum of
+# its prefix, so they are cached per prefix sum.
+# ---------------------------------------------------------------------------
+
+happy_block = 10 ** 4
+happy_table_size = 4096         # covers every value reached from n < 10**50
+square_sums = None
+happy_table = None
+square_sum_hist = [[1]]         # square sums of L-digit strings, by count
+
+
+def get_square_sums():
+    global square_sums
+    if square_sums is None:
+        square_sums = [0] * happy_block
+        for x in range(1, happy_block):
+            square_sums[x] = square_sums[x // 10] + (x % 10) ** 2
+    return square_sums
+
+
+def digit_square_sum(n):
+    sums = get_square_sums()
+    total = 0
+    while n > 0:
+        n, block = divmod(n, happy_block)
+        total += sums[block]
+    return total
+
+
+def get_happy_table():
+    global happy_table
+    if happy_table is None:
+        table = bytearray(happy_table_size)
+        for v in range(1, happy_table_size):
+            seen = set()
+            n = v
+            while n != 1 and n not in seen:
+                seen.add(n)
+                n = digit_square_sum(n)
+            table[v] = n == 1
+        happy_table = table
+    return happy_table
+
+
+def is_happy_number(n):
+    n = int(n)
+    if n <= 0:
+        return False
+    table = get_happy_table()
+    while n >= len(table):
+        n = digit_square_sum(n)
+    return bool(table[n])
+
+
+# flags of prefix*10**4 + x for x in 0..9999, given the prefix's square sum
+@functools.lru_cache(maxsize=4096)
+def happy_block_flags(prefix_sum):
+    return bytes(is_happy_number(prefix_sum + v) if prefix_sum + v else 0 for v in get_square_sums())
+
+
+# chunks of flag bytes (1 = happy), one byte per number in [a, b]
+def happy_flags(a, b):
+    a = max(int(a), 0)
+    b = int(b)
+    for block in range(a // happy_block, b // happy_block + 1):
+        start = block * happy_block
+        flags = happy_block_flags(digit_square_sum(block))
+        lo = max(a - start, 0)
+        hi = min(b - start + 1, happy_block)
+        yield flags if (lo, hi) == (0, happy_block) else flags[lo:hi]
+
+
+# packed bitmap of [a, b]: bit i (lowest bit first) of byte i // 8 is set
+# when a + i is happy
+def happy_bitmap(a, b):
+    to_ascii = bytes.maketrans(b"\x00\x01", b"01")
+    packed = []
+    pending = b""
+    for flags in happy_flags(a, b):
+        flags = pending + flags
+        cut = len(flags) - len(flags) % 8
+        if cut:
+            packed.append(int(flags[:cut].translate(to_ascii)[::-1], 2).to_bytes(cut // 8, "little"))
+        pending = flags[cut:]
+    if pending:
+        packed.append(int(pending.translate(to_ascii)[::-1], 2).to_bytes(1, "little"))
+    return b"".join(packed)
+
+
+# how many L-digit strings have each digit-square sum
+def square_sum_counts(L):
+    while len(square_sum_hist) <= L:
+        prev = square_sum_hist[-1]
+        hist = [0] * (len(prev) + 81)
+        for v, c in enumerate(prev):
+            if c:
+                for d in range(10):
+                    hist[v + d * d] += c
+        square_sum_hist.append(hist)
+    return square_sum_hist[L]
+
+
+# happy numbers in [1, N], counted digit by digit from the square-sum
+# histograms instead of number by number
+def count_happy(N):
+    N = int(N)
+    if N < 1:
+        return 0
+    digits = [int(c) for c in str(N)]
+    total = 0
+    prefix_sum = 0
+    for i, D in enumerate(digits):
+        hist = square_sum_counts(len(digits) - i - 1)
+        for d in range(D):
+            base = prefix_sum + d * d
+            total += sum(c for v, c in enumerate(hist) if c and is_happy_number(base + v))
+        prefix_sum += D * D
+    return total + is_happy_number(N)
+
+
+def count_happy_between(a, b):
+    return count_happy(b) - count_happy(int(a) - 1)
+
+
+# ---------------------------------------------------------------------------
+# strong numbers (factorions): numbers equal to the sum of the factorials of
+# their digits, in any base from 2 to 16. a d-digit number is at least
+# base**(d-1) but its digit factorials add up to at most d * (base-1)!, so
+# past the first d where the first beats the second there are none; below
+# that bound the digit multiset search finds them all.
+# ---------------------------------------------------------------------------
+
+factorials = [math.factorial(d) for d in range(16)]
+factorial_of_char = {str(d): factorials[d] for d in range(10)}
+
+
+def factorion_max_length(base):
+    d = 1
+    while base ** d <= (d + 1) * factorials[base - 1]:
+        d += 1
+    return d
+
+
+def strong_numbers(base=10):
+    base = int(base)
+    if not 2 <= base <= 16:
+        raise ValueError("base must be from 2 to 16")
+    found = []
+    for length in range(1, factorion_max_length(base) + 1):
+        found += digit_multiset_search(factorials[:base], base, length)
+    return found
+
+
+# is each of the numbers a strong number (base 10)?
+def are_strong(numbers):
+    result = []
+    for num in numbers:
+        num = int(num)
+        result.append(num >= 0 and sum(map(factorial_of_char.__getitem__, str(num))) == num)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# electricity tariff. a tariff is data: (upper limit of the slab, rate per
+# unit) pairs in order, with None as the limit of the last slab. bulk
+# billing looks readings up in a table of bills (one entry per unit count),
+# so a whole chunk is billed by one map() over the table. every entry is
+# worked out the way slab_bill does it (the bill at the start of the slab
+# plus rate * units into it), so with fractional rates too the two agree
+# to the last bit.
+# ---------------------------------------------------------------------------
+
+default_tariff = ((100, 5), (200, 7), (None, 10))
+tariff_table_size = 1 << 16     # readings below this come from the table
+reading_chunk_size = 1 << 16
+
+
+def slab_bill(units, tariff=default_tariff):
+    bill = 0
+    lower = 0
+    for upper, rate in tariff:
+        if units <= lower:
+            break
+        top = units if upper is None else min(units, upper)
+        bill += rate * (top - lower)
+        if upper is None:
+            break
+        lower = upper
+    return bill
+
+
+def tariff_typecode(tariff):
+    return "q" if all(isinstance(rate, int) for upper, rate in tariff) else "d"
+
+
+# table[u] is the bill for u units
+@functools.lru_cache(maxsize=16)
+def tariff_table(tariff=default_tariff):
+    table = array(tariff_typecode(tariff), [0])
+    lower = 0
+    for upper, rate in tariff:
+        upper = tariff_table_size - 1 if upper is None else min(upper, tariff_table_size - 1)
+        if upper > lower:
+            base = slab_bill(lower, tariff)
+            table.extend(base + rate * units for units in range(1, upper - lower + 1))
+            lower = upper
+    return table
+
+
+# bills for a chunk of readings; negative readings are billed as 0 units
+def bills(readings, tariff=default_tariff):
+    table = tariff_table(tariff)
+    if readings and 0 <= min(readings) and max(readings) < len(table):
+        return array(table.typecode, map(table.__getitem__, readings))
+    return array(table.typecode, (table[u] if 0 <= u < len(table) else slab_bill(u, tariff) for u in readings))
+
+
+# numbers from one column of a CSV file, as array chunks ("q" for integers,
+# "d" for floats). a first row that does not parse is a header and is
+# skipped. later rows that do not parse are skipped too, unless `invalid`
+# is given: then they read as that value, so the numbers stay row for row.
+def read_csv_column(path, column=0, typecode="q", invalid=None):
+    import csv
+    convert = int if typecode == "q" else float
+    with open(path, newline="", encoding="utf-8") as f:
+        chunk = array(typecode)
+        for row_no, row in enumerate(csv.reader(f)):
+            try:
+                value = convert(row[column])
+                if value != value:
+                    raise ValueError("nan")
+            except (ValueError, IndexError):
+                if invalid is None or row_no == 0:
+                    continue
+                value = invalid
+            chunk.append(value)
+            if len(chunk) >= reading_chunk_size:
+                yield chunk
+                chunk = array(typecode)
+        if chunk:
+            yield chunk
+
+
+# readings from a raw binary file of machine integers (int64 by default),
+# memory-mapped and read a chunk at a time
+def read_readings_binary(path, typecode="q"):
+    size = array(typecode).itemsize
+    with mapped_file(path) as mm:
+        end = len(mm) - len(mm) % size
+        step = reading_chunk_size * size
+        for start in range(0, end, step):
+            chunk = array(typecode)
+            chunk.frombytes(mm[start:min(start + step, end)])
+            yield chunk
+
+
+# integers from one number per line of stdin, as array chunks
+def read_stdin_numbers(typecode="q"):
+    convert = int if typecode == "q" else float
+    chunk = array(typecode)
+    for line in sys.stdin:
+        try:
+            chunk.append(convert(line))
+        except ValueError:
+            continue
+        if len(chunk) >= reading_chunk_size:
+            yield chunk
+            chunk = array(typecode)
+    if chunk:
+        yield chunk
+
+
+# array chunks from a .csv file (one column), a raw binary file or '-' for
+# stdin
+def read_number_file(path, typecode="q", column=0):
+    if path == "-":
+        return read_stdin_numbers(typecode)
+    if path.lower().endswith(".csv"):
+        return read_csv_column(path, column, typecode)
+    return read_readings_binary(path, typecode)
+
+
+# bills for every reading in a .csv or binary file, one chunk at a time
+def bill_file(path, tariff=default_tariff, column=0):
+    for chunk in read_number_file(path, column=column):
+        yield bills(chunk, tariff)
+
+
+def bill_main(path, column=0):
+    for chunk in bill_file(path, column=column):
+        sys.stdout.write("".join(f"{bill}\n" for bill in chunk))
+
+
+# ---------------------------------------------------------------------------
+# threshold classification (grades, age groups, BMI). a band table is data:
+# sorted cut points and one label per interval between them, None where
+# the value is invalid. a value falls in interval bisect_right(cuts, value),
+# and whole columns go through map() so there is no Python-level loop.
+# ---------------------------------------------------------------------------
+
+bands = {
+    "grade": ((0, 35, 50, 75, 90, 101), (None, "Fail", "D", "C", "B", "A", None)),
+    "age": ((0, 13, 20, 60), (None, "Child", "Teenager", "Adult", "Senior")),
+    "bmi": ((0, 18.5, 25, 30), (None, "Underweight", "Normal", "Overweight", "Obese")),
+}
+
+
+def classify(value, band):
+    cuts, labels = bands[band]
+    return labels[bisect.bisect_right(cuts, value)]
+
+
+def classify_many(values, band):
+    cuts, labels = bands[band]
+    return list(map(labels.__getitem__, map(bisect.bisect_right, itertools.repeat(cuts), values)))
+
+
+# labels every value in one column of a CSV file, writing one label per
+# row to `out` if given, and returns how many rows got each label
+def classify_file(path, band, column=0, out=None):
+    cuts, labels = bands[band]
+    labels = [label or "invalid" for label in labels]
+    histogram = collections.Counter()
+    # a row that does not parse reads as -inf, below every band's first
+    # cut, so it gets the band's "invalid" label
+    for chunk in read_csv_column(path, column, "d", -math.inf):
+        indexes = list(map(bisect.bisect_right, itertools.repeat(cuts), chunk))
+        histogram.update(indexes)
+        if out is not None:
+            out.write("\n".join(map(labels.__getitem__, indexes)) + "\n")
+    result = collections.Counter()
+    for i, count in sorted(histogram.items()):
+        result[labels[i]] += count
+    return dict(result)
+
+
+def classify_main(band, path):
+    histogram = classify_file(path, band, out=sys.stdout)
+    write_json_line(histogram, sys.stderr)
+
+
+# ---------------------------------------------------------------------------
+# ATM ledger. balances are integer cents. every account has its own lock,
+# so operations on different accounts run concurrently from any number of
+# threads (asyncio clients can call in through asyncio.to_thread).
+#
+# durability: each change is appended to a write-ahead log before it is
+# applied. a single writer thread does the appends and fsyncs once per
+# batch of whatever is waiting (group commit), so many clients share one
+# fsync. every `snapshot_every` records the writer saves all balances to a
+# snapshot and starts a fresh log, so restart only replays a short log.
+# log lines are "seq account delta balance".
+# ---------------------------------------------------------------------------
+
+atm_ledger_dir = "atm_ledger"
+atm_opening_balance = 100000        # new accounts start with $1000.00
+
+
+def to_cents(amount):
+    from decimal import Decimal, InvalidOperation
+    try:
+        cents = Decimal(str(amount).strip()) * 100
+    except InvalidOperation:
+        raise ValueError("Invalid input. Please enter a valid amount.")
+    if not cents.is_finite() or cents != cents.to_integral_value():
+        raise ValueError("Invalid input. Please enter a valid amount.")
+    return int(cents)
+
+
+def format_cents(cents):
+    return f"{cents // 100}.{cents % 100:02d}" if cents >= 0 else "-" + format_cents(-cents)
+
+
+class Ledger:
+    def __init__(self, directory=None, opening_balance=0, snapshot_every=100000):
+        import queue
+        import threading
+        self.directory = directory
+        self.opening_balance = opening_balance
+        self.snapshot_every = snapshot_every
+        self.balances = {}
+        self.locks = {}
+        self.locks_lock = threading.Lock()
+        self.seq = 0
+        self.writer = None
+        self.failure = None     # the error that stopped the writer, if any
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self.log_path = os.path.join(directory, "wal.log")
+            self.snapshot_path = os.path.join(directory, "snapshot.json")
+            self.recover()
+            self.log = open(self.log_path, "a", encoding="utf-8")
+            self.pending = queue.Queue()
+            self.writer = threading.Thread(target=self.write_loop, daemon=True)
+            self.writer.start()
+
+    def recover(self):
+        import json
+        snapshot_seq = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            snapshot_seq = snapshot["seq"]
+            self.balances.update(snapshot["balances"])
+        self.seq = snapshot_seq
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "r+b") as f:
+                end = 0                     # just past the last whole record
+                for line in f:
+                    fields = line.split()
+                    if len(fields) != 4 or not line.endswith(b"\n"):
+                        break               # torn last write
+                    seq = int(fields[0])
+                    if seq > snapshot_seq:
+                        self.balances[fields[1].decode("utf-8")] = int(fields[3])
+                        self.seq = seq
+                    end += len(line)
+                # cut the torn bytes off, or the next record would be
+                # appended to them and lost on the following recovery
+                f.truncate(end)
+        self.logged = dict(self.balances)   # the writer's copy
+        self.since_snapshot = self.seq - snapshot_seq
+
+    def write_loop(self):
+        import queue
+        while True:
+            batch = [self.pending.get()]
+            while True:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            records = [item for item in batch if item is not None]
+            if records:
+                try:
+                    if self.failure is not None:
+                        raise self.failure
+                    self.write_records(records)
+                except Exception as e:
+                    # the log can no longer be trusted: fail this batch and
+                    # every later one instead of leaving the callers waiting
+                    self.failure = e
+                    for record, done, outcome in records:
+                        outcome.append(e)
+                        done.set()
+            if None in batch:
+                return
+
+    def write_records(self, records):
+        self.log.write("".join(record for record, done, outcome in records))
+        self.log.flush()
+        os.fsync(self.log.fileno())
+        for record, done, outcome in records:
+            seq, account, delta, balance = record.split()
+            self.logged[account] = int(balance)
+            done.set()
+        self.since_snapshot += len(records)
+        if self.since_snapshot >= self.snapshot_every:
+            self.write_snapshot(int(records[-1][0].split()[0]))
+
+    def write_snapshot(self, seq):
+        import json
+        temp = self.snapshot_path + ".tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump({"seq": seq, "balances": self.logged}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, self.snapshot_path)
+        self.log.close()
+        self.log = open(self.log_path, "w", encoding="utf-8")
+        self.since_snapshot = 0
+
+    def lock_for(self, account):
+        lock = self.locks.get(account)
+        if lock is None:
+            import threading
+            with self.locks_lock:
+                lock = self.locks.setdefault(account, threading.Lock())
+        return lock
+
+    def balance(self, account):
+        return self.balances.get(str(account), self.opening_balance)
+
+    def change(self, account, delta):
+        account = str(account)
+        with self.lock_for(account):
+            balance = self.balances.get(account, self.opening_balance) + delta
+            if balance < 0:
+                raise ValueError("Insufficient balance.")
+            if self.writer is not None:
+                import threading
+                done = threading.Event()
+                outcome = []            # gets the writer's error if the write fails
+                # seqs reach the writer in order, so a snapshot never
+                # covers a record that is still on its way to the log
+                with self.locks_lock:
+                    self.seq += 1
+                    self.pending.put((f"{self.seq} {account} {delta} {balance}\n", done, outcome))
+                done.wait()
+                if outcome:
+                    raise outcome[0]
+            self.balances[account] = balance
+            return balance
+
+    def deposit(self, account, cents):
+        if cents <= 0:
+            raise ValueError("Deposit amount must be positive.")
+        return self.change(account, cents)
+
+    def withdraw(self, account, cents):
+        if cents <= 0:
+            raise ValueError("Withdrawal amount must be positive.")
+        return self.change(account, -cents)
+
+    def close(self):
+        if self.writer is not None:
+            self.pending.put(None)
+            self.writer.join()
+            self.log.close()
+            self.writer = None
+
+
+# ---------------------------------------------------------------------------
+# text scanner (questions 15 and 25) for large ASCII text files. the file is
+# memory-mapped and read in chunks. a translate table maps every byte to its
+# class, so counting a class is one bytes.count; the pangram test keeps a
+# 26-bit mask of the letters seen and only looks for the missing ones. the
+# input is never lowercased or copied as a whole. bytes outside ASCII count
+# as symbols.
+# ---------------------------------------------------------------------------
+
+char_classes = ("uppercase", "lowercase", "digit", "whitespace", "symbol")
+char_class_table = None
+full_letter_mask = (1 << 26) - 1
+
+
+def get_char_class_table():
+    global char_class_table
+    if char_class_table is None:
+        char_class_table = bytes(
+            1 if 65 <= b <= 90 else 2 if 97 <= b <= 122 else 3 if 48 <= b <= 57 else 4 if b in b" \t\r\n\v\f" else 5
+            for b in range(256)
+        )
+    return char_class_table
+
+
+# adds the letters found in data to the mask
+def letter_mask(data, mask=0):
+    for i in range(26):
+        if not mask >> i & 1 and (97 + i in data or 65 + i in data):
+            mask |= 1 << i
+    return mask
+
+
+def char_class_counts(data, counts=None):
+    counts = counts or dict.fromkeys(char_classes, 0)
+    codes = data.translate(get_char_class_table())
+    for code, name in enumerate(char_classes, 1):
+        counts[name] += codes.count(code)
+    return counts
+
+
+# stops reading as soon as every letter has been seen
+def is_pangram_file(path):
+    mask = 0
+    for chunk in mapped_chunks(path):
+        mask = letter_mask(chunk, mask)
+        if mask == full_letter_mask:
+            return True
+    return False
+
+
+# pangram status and character counts for the whole file in one pass
+def scan_text_file(path):
+    mask = 0
+    counts = dict.fromkeys(char_classes, 0)
+    for chunk in mapped_chunks(path):
+        if mask != full_letter_mask:
+            mask = letter_mask(chunk, mask)
+        char_class_counts(chunk, counts)
+    return {"pangram": mask == full_letter_mask, **counts}
+
+
+# the same for every line of the file
+def scan_text_lines(path):
+    for number, line in enumerate(mapped_lines(path), 1):
+        yield {"line": number, "pangram": letter_mask(line) == full_letter_mask, **char_class_counts(line)}
+
+
+def scan_main(path, per_line=False):
+    for result in (scan_text_lines(path) if per_line else (scan_text_file(path),)):
+        write_json_line(result)
+
+
+# ---------------------------------------------------------------------------
+# palindromes (question 36). the check compares the front and the back of
+# the buffer a chunk at a time, moving inwards, so only one chunk is ever
+# reversed and nothing else is copied; on a memory-mapped file this reads
+# every byte once. Manacher's algorithm finds the longest palindromic
+# substring in linear time.
+# ---------------------------------------------------------------------------
+
+palindrome_chunk_size = 1 << 16
+
+
+# works on str, bytes or an mmap
+def is_palindrome_buffer(buf, chunk_size=None):
+    chunk_size = chunk_size or palindrome_chunk_size
+    i, j = 0, len(buf)
+    while j - i > 1:
+        k = min(chunk_size, (j - i) // 2)
+        if buf[i:i + k] != buf[j - k:j][::-1]:
+            return False
+        i += k
+        j -= k
+    return True
+
+
+# is the file's content (without a final line ending) a palindrome?
+def is_palindrome_file(path):
+    with mapped_file(path) as mm:
+        end = len(mm)
+        if mm[end - 1:end] == b"\n":
+            end -= 2 if mm[end - 2:end] == b"\r\n" else 1
+        if end == len(mm):
+            return is_palindrome_buffer(mm)
+        with memoryview(mm) as view, view[:end] as body:
+            return is_palindrome_buffer(body)
+
+
+# one result per line of the file
+def palindrome_lines(path):
+    for line in mapped_lines(path):
+        yield line == line[::-1]
+
+
+# (start, length) of the longest palindromic substring of s
+def longest_palindrome(s):
+    n = len(s)
+    if n == 0:
+        return 0, 0
+    odd = array("l", bytes(8 * n))      # radius of the odd palindrome at i
+    even = array("l", bytes(8 * n))     # radius of the even one ending at i
+    best = (0, 1)
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        odd[i] = k
+        if k > 0 and 2 * k - 1 > best[1]:
+            best = (i - k + 1, 2 * k - 1)
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        even[i] = k
+        if 2 * k > best[1]:
+            best = (i - k, 2 * k)
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+    return best
+
+
+# ---------------------------------------------------------------------------
+# digit sums and digital roots (questions 32 and 37) of decimal numbers of
+# any size, read as bytes. the sum is counted one digit value at a time
+# with bytes.count, and the digital root follows from the sum because a
+# number and its digit sum agree modulo 9, so the number is never turned
+# into an int (and never hits the int/str conversion limit).
+# ---------------------------------------------------------------------------
+
+digit_bytes = b"0123456789"
+number_separators = b" \t\r\n"
+
+
+def bytes_digit_sum(data):
+    return sum(d * data.count(48 + d) for d in range(1, 10))
+
+
+def digital_root_of_sum(digit_sum):
+    return 0 if digit_sum == 0 else 1 + (digit_sum - 1) % 9
+
+
+# digit sum of one integer given as text (an optional sign, then digits)
+def number_digit_sum(text):
+    if isinstance(text, int):
+        text = str(text)
+    if isinstance(text, str):
+        text = text.encode("ascii", "replace")
+    text = text.strip()
+    if text[:1] in (b"-", b"+"):
+        text = text[1:]
+    if not text or text.translate(None, digit_bytes):
+        raise ValueError("Invalid input. Please enter a valid integer.")
+    return bytes_digit_sum(text)
+
+
+# the input as chunks of bytes: a file (memory-mapped) or '-' for stdin.
+# pipes and other files that cannot be mapped are read normally.
+def input_chunks(path):
+    if path != "-" and os.path.isfile(path):
+        yield from mapped_chunks(path)
+        return
+    stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        yield from iter(lambda: stream.read(text_chunk_size), b"")
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+
+
+# a sign that does not start a number: one after anything but whitespace,
+# or one not followed by a digit
+misplaced_sign = rb"[^ \t\r\n][-+]|[-+](?=[^0-9])"
+
+
+# digit sum and digital root of everything in the input: one huge number,
+# or many numbers separated by whitespace (a sign in front of a number is
+# ignored)
+def digit_sum_stream(path):
+    import re
+    total = 0
+    last = b" "     # the byte before the chunk, for a sign on the boundary
+    for chunk in input_chunks(path):
+        if (chunk.translate(None, digit_bytes + number_separators + b"-+")
+                or re.search(misplaced_sign, last + chunk[:1]) or re.search(misplaced_sign, chunk)):
+            raise ValueError("input contains something other than integers")
+        total += bytes_digit_sum(chunk)
+        last = chunk[-1:]
+    if last in (b"-", b"+"):
+        raise ValueError("input contains something other than integers")
+    return {"digit_sum": total, "digital_root": digital_root_of_sum(total)}
+
+
+# the same for every line of the input
+def digit_sum_lines(path):
+    parts = []
+    number = 1
+    for chunk in input_chunks(path):
+        lines = chunk.split(b"\n")
+        for line in lines[:-1]:
+            parts.append(line)
+            total = number_digit_sum(b"".join(parts)) if any(p.strip() for p in parts) else 0
+            yield {"line": number, "digit_sum": total, "digital_root": digital_root_of_sum(total)}
+            parts = []
+            number += 1
+        parts.append(lines[-1])
+    if any(p.strip() for p in parts):
+        total = number_digit_sum(b"".join(parts))
+        yield {"line": number, "digit_sum": total, "digital_root": digital_root_of_sum(total)}
+
+
+def digit_sum_main(path, per_line=False):
+    for result in (digit_sum_lines(path) if per_line else (digit_sum_stream(path),)):
+        write_json_line(result)
+
+
+# ---------------------------------------------------------------------------
+# duck numbers in files (question 33). a file of one number per line is
+# memory-mapped and searched with a multiline regex, so every line is
+# matched in C; big files are cut into regions at line boundaries and the
+# regions are searched by worker processes.
+# ---------------------------------------------------------------------------
+
+duck_region_size = 1 << 24
+
+# kind -> pattern for a whole matching line ("zero" is any number with a
+# zero digit, leading zeros included; "zero-free" is a number without any)
+duck_patterns = {
+    "duck": rb"^[1-9][0-9]*0[0-9]*(?=\r?$)",
+    "zero": rb"^[0-9]*0[0-9]*(?=\r?$)",
+    "zero-free": rb"^[1-9]+(?=\r?$)",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def duck_pattern(kind):
+    import re
+    return re.compile(duck_patterns[kind], re.M)
+
+
+# (start, end) byte ranges of about `size` bytes, each ending after a newline
+def line_regions(mm, size=None):
+    size = size or duck_region_size
+    regions = []
+    start = 0
+    while start < len(mm):
+        end = mm.find(b"\n", start + size - 1)
+        end = len(mm) if end < 0 else end + 1
+        regions.append((start, end))
+        start = end
+    return regions
+
+
+# the matching numbers in one region of the file (or just how many)
+def duck_region(path, start, end, kind="duck", count_only=False):
+    pattern = duck_pattern(kind)
+    with mapped_file(path) as mm:
+        if count_only:
+            return sum(1 for _ in pattern.finditer(mm, start, end))
+        return [match.group().decode() for match in pattern.finditer(mm, start, end)]
+
+
+def duck_regions(path, kind, count_only, workers):
+    if kind not in duck_patterns:
+        raise ValueError(f"unknown kind {kind!r}, expected one of {', '.join(duck_patterns)}")
+    with mapped_file(path) as mm:
+        regions = line_regions(mm)
+    tasks = [(path, start, end, kind, count_only) for start, end in regions]
+    if len(tasks) <= 1 or workers == 1:
+        return (duck_region(*task) for task in tasks)
+    return bounded_map(duck_region, tasks, workers)
+
+
+# the matching numbers of the file, in file order
+def duck_numbers_in_file(path, kind="duck", workers=None):
+    for matches in duck_regions(path, kind, False, workers):
+        yield from matches
+
+
+def count_duck_numbers_in_file(path, kind="duck", workers=None):
+    return sum(duck_regions(path, kind, True, workers))
+
+
+def duck_main(path, kind="duck", count_only=False):
+    if count_only:
+        write_json_line({"kind": kind, "count": count_duck_numbers_in_file(path, kind)})
+        return
+    for number in duck_numbers_in_file(path, kind):
+        sys.stdout.write(number + "\n")
+
+
+# ---------------------------------------------------------------------------
+# selection (questions 4, 11, 17 and 20): min, max and the k largest and
+# smallest values of a stream in one pass. values come in array chunks;
+# min() and max() run over a whole chunk at a time and heapq.nlargest /
+# nsmallest merge the chunk with the k values kept so far, so memory is
+# O(k) plus one chunk however long the stream is.
+# ---------------------------------------------------------------------------
+
+def select_chunks(chunks, k=1):
+    count = 0
+    low = high = None
+    top = []
+    bottom = []
+    for chunk in chunks:
+        if not len(chunk):
+            continue
+        count += len(chunk)
+        chunk_low, chunk_high = min(chunk), max(chunk)
+        low = chunk_low if low is None else min(low, chunk_low)
+        high = chunk_high if high is None else max(high, chunk_high)
+        if k:
+            top = heapq.nlargest(k, itertools.chain(top, chunk))
+            bottom = heapq.nsmallest(k, itertools.chain(bottom, chunk))
+    return {"count": count, "min": low, "max": high, "top": top, "bottom": bottom}
+
+
+def select_values(values, k=1):
+    values = iter(values)
+    return select_chunks(iter(lambda: list(itertools.islice(values, reading_chunk_size)), []), k)
+
+
+def select_file(path, k=1, typecode="q"):
+    return select_chunks(read_number_file(path, typecode), k)
+
+
+def select_main(path, k=1):
+    write_json_line(select_file(path, k))
+
+
+# ---------------------------------------------------------------------------
+# calendar predicates (questions 3 and 18) in the proleptic Gregorian
+# calendar. the rules repeat every 400 years, so the flags of every year
+# come from a 400-entry table indexed by year % 400; a chunk of years goes
+# through map() into a bytes object of flags, and the masks and counts are
+# taken from that with bytes.translate and bytes.count.
+# ---------------------------------------------------------------------------
+
+calendar_bits = {"leap": 1, "century": 2, "century_leap": 4}
+calendar_table = None
+calendar_mask_tables = None     # one translate table per predicate, flags -> 0/1
+
+
+def get_calendar_table():
+    global calendar_table, calendar_mask_tables
+    if calendar_table is None:
+        calendar_mask_tables = {
+            name: bytes(1 if code & bit else 0 for code in range(256)) for name, bit in calendar_bits.items()
+        }
+        calendar_table = bytes(
+            (y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)) | (y % 100 == 0) << 1 | (y % 400 == 0) << 2
+            for y in range(400)
+        )
+    return calendar_table
+
+
+def year_flags(year):
+    return get_calendar_table()[year % 400]
+
+
+def is_gregorian_leap(year):
+    return bool(year_flags(year) & calendar_bits["leap"])
+
+
+def calendar_flags(years):
+    return bytes(map(get_calendar_table().__getitem__, map((400).__rmod__, years)))
+
+
+# one 0/1 byte per year for every predicate
+def calendar_masks(years):
+    flags = calendar_flags(years)
+    return {name: flags.translate(table) for name, table in calendar_mask_tables.items()}
+
+
+def count_calendar_flags(flags, counts):
+    for code in set(get_calendar_table()):
+        found = flags.count(code)
+        for name, bit in calendar_bits.items():
+            if code & bit:
+                counts[name] += found
+
+
+# how many years in one column of a .csv or binary int64 file are leap,
+# century and century-leap years
+def calendar_counts(path, column=0):
+    counts = {"years": 0, **dict.fromkeys(calendar_bits, 0)}
+    for chunk in read_number_file(path, "q", column):
+        counts["years"] += len(chunk)
+        count_calendar_flags(calendar_flags(chunk), counts)
+    return counts
+
+
+def calendar_main(path, column=0):
+    write_json_line(calendar_counts(path, column))
+
+
+# ---------------------------------------------------------------------------
+# power sums (question 29): 1^k + 2^k + ... + n^k in closed form with
+# Faulhaber's formula, a polynomial in n of degree k + 1 whose coefficients
+# come from the Bernoulli numbers. the polynomial is kept as integer
+# coefficients over one common denominator, so evaluating it (exactly, or
+# modulo m for huge n) is a Horner loop over k + 2 integers.
+# ---------------------------------------------------------------------------
+
+bernoulli_numbers = []     # B_0, B_1, ... (B_1 = -1/2), grown on demand
+
+
+def bernoulli(m):
+    from fractions import Fraction
+    if not bernoulli_numbers:
+        bernoulli_numbers.append(Fraction(1))
+    while len(bernoulli_numbers) <= m:
+        j = len(bernoulli_numbers)
+        total = sum(math.comb(j + 1, i) * b for i, b in enumerate(bernoulli_numbers))
+        bernoulli_numbers.append(-total / (j + 1))
+    return bernoulli_numbers[m]
+
+
+# (denominator, coefficients of n^0 .. n^(k+1)) of the sum of i^k for i = 1..n
+@functools.lru_cache(maxsize=None)
+def power_sum_polynomial(k):
+    from fractions import Fraction
+    coefficients = [Fraction(0)] * (k + 2)
+    for j in range(k + 1):
+        b = -bernoulli(j) if j == 1 else bernoulli(j)
+        coefficients[k + 1 - j] = math.comb(k + 1, j) * b / (k + 1)
+    denominator = math.lcm(*(c.denominator for c in coefficients))
+    return denominator, tuple(int(c * denominator) for c in coefficients)
+
+
+# 1^k + ... + n^k (0 for n < 1), or that sum modulo `mod`
+def power_sum(n, k=2, mod=None):
+    if k < 0:
+        raise ValueError("k must be non-negative")
+    if n < 1:
+        return 0
+    denominator, coefficients = power_sum_polynomial(k)
+    # the numerator is a multiple of the denominator, so working modulo
+    # denominator * mod and dividing at the end gives the sum modulo mod
+    modulus = denominator * mod if mod else None
+    total = 0
+    for c in reversed(coefficients):
+        total = total * n + c
+        if modulus:
+            total %= modulus
+    return total // denominator
+
+
+# power_sum for many (n, k) pairs
+def power_sums(pairs, mod=None):
+    return [power_sum(n, k, mod) for n, k in pairs]
+
+
+# power_sum(n, k) for an array of n: an array('q') when every result fits
+# in int64, otherwise a list of exact ints
+def power_sums_array(ns, k=2, mod=None):
+    results = list(map(power_sum, ns, itertools.repeat(k), itertools.repeat(mod)))
+    if results and max(results) < 1 << 63:
+        return array("q", results)
+    return results if results else array("q")
+
+
+# ---------------------------------------------------------------------------
+# result cache for the expensive questions that are pure functions of their
+# input (primes, happy numbers, prime factors, Collatz, Kaprekar). results
+# are kept under (question, normalized args) in two tiers: a bounded LRU
+# in memory and, behind it, an SQLite table that survives restarts. rows
+# can expire after a TTL, and the table is trimmed back to max_rows (least
+# recently used first) every so many writes. values are stored as JSON, so
+# both tiers hand back the same types. a process that was forked from the
+# one that opened the cache (a pool worker) opens its own connection.
+# ---------------------------------------------------------------------------
+
+cached_questions = frozenset({22, 34, 35, 38, 39})
+result_cache_path = "result_cache.sqlite"
+result_cache_size = 4096            # entries kept in memory
+result_cache_memory = 64 << 20      # characters of JSON kept in memory
+result_cache_max_rows = 1 << 20     # rows kept on disk
+result_cache_trim_every = 1024      # writes between two trims of the table
+result_cache = None                 # the cache solve() uses, if any
+
+
+# numbers given as text and as ints get the same key
+def normalize_arg(arg):
+    if isinstance(arg, str):
+        arg = arg.strip()
+        try:
+            return int(arg)
+        except ValueError:
+            return arg
+    return arg
+
+
+def result_cache_key(question, args):
+    import json
+    if isinstance(args, dict):
+        args = sorted((name, normalize_arg(value)) for name, value in args.items())
+    else:
+        args = list(map(normalize_arg, args))
+    return json.dumps([int(question), args], separators=(",", ":"))
+
+
+class ResultCache:
+    def __init__(self, path=None, size=None, max_rows=None, ttl=None):
+        self.path = path
+        self.size = size or result_cache_size
+        self.max_rows = max_rows or result_cache_max_rows
+        self.ttl = ttl
+        self.memory = collections.OrderedDict()     # key -> (json, expires)
+        self.memory_used = 0                        # characters of JSON in memory
+        self.counts = collections.Counter()
+        self.writes = 0
+        self.connection = None
+        self.pid = None
+
+    def db(self):
+        if self.path is None:
+            return None
+        if self.pid != os.getpid():
+            import sqlite3
+            self.connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL, used REAL NOT NULL)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+            self.pid = os.getpid()
+        return self.connection
+
+    # (True, value) on a hit, (False, None) on a miss
+    def get(self, key):
+        import json
+        now = time.time()
+        entry = self.memory.get(key)
+        if entry is not None:
+            if entry[1] is None or entry[1] > now:
+                self.memory.move_to_end(key)
+                self.counts["memory_hits"] += 1
+                return True, json.loads(entry[0])
+            self.forget(key)
+        db = self.db()
+        if db is not None:
+            row = db.execute("SELECT value, expires FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None and (row[1] is None or row[1] > now):
+                db.execute("UPDATE results SET used = ? WHERE key = ?", (now, key))
+                self.remember(key, row[0], row[1])
+                self.counts["disk_hits"] += 1
+                return True, json.loads(row[0])
+        self.counts["misses"] += 1
+        return False, None
+
+    # stores value and returns it the way a later hit will (through JSON)
+    def put(self, key, value):
+        import json
+        now = time.time()
+        text = json.dumps(value)
+        expires = now + self.ttl if self.ttl else None
+        self.remember(key, text, expires)
+        db = self.db()
+        if db is not None:
+            db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", (key, text, expires, now))
+            self.writes += 1
+            if self.writes % result_cache_trim_every == 0:
+                self.trim()
+        return json.loads(text)
+
+    # keeps at most `size` entries and result_cache_memory characters of
+    # JSON; a value bigger than that on its own is only kept on disk
+    def remember(self, key, text, expires):
+        self.forget(key)
+        if len(text) > result_cache_memory:
+            return
+        self.memory[key] = (text, expires)
+        self.memory_used += len(text)
+        while len(self.memory) > self.size or self.memory_used > result_cache_memory:
+            self.memory_used -= len(self.memory.popitem(last=False)[1][0])
+
+    def forget(self, key):
+        entry = self.memory.pop(key, None)
+        if entry is not None:
+            self.memory_used -= len(entry[0])
+
+    # drops expired rows, then the least recently used ones above max_rows
+    def trim(self):
+        db = self.db()
+        if db is None:
+            return
+        db.execute("DELETE FROM results WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+        excess = db.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_rows
+        if excess > 0:
+            db.execute("DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY used LIMIT ?)", (excess,))
+
+    def stats(self):
+        db = self.db()
+        return {
+            "memory_hits": self.counts["memory_hits"],
+            "disk_hits": self.counts["disk_hits"],
+            "misses": self.counts["misses"],
+            "memory_entries": len(self.memory),
+            "disk_entries": db.execute("SELECT COUNT(*) FROM results").fetchone()[0] if db is not None else 0,
+        }
+
+    def close(self):
+        if self.connection is not None and self.pid == os.getpid():
+            self.trim()
+            self.connection.close()
+        self.connection = None
+        self.pid = None
+
+
+# makes solve() go through a cache (path=None keeps it in memory only)
+def enable_result_cache(path=result_cache_path, ttl=None):
+    global result_cache
+    result_cache = ResultCache(path, ttl=ttl)
+    return result_cache
+
+
+def disable_result_cache():
+    global result_cache
+    if result_cache is not None:
+        result_cache.close()
+    result_cache = None
+
+
+# ---------------------------------------------------------------------------
+# range scans: the numbers in [a, b] with some property, or how many there
+# are. a kernel takes a whole chunk [lo, hi) and returns its matches in
+# increasing order (or only their count with count_only), working on the
+# chunk at once (a sieve, flag bytes, digit DP) rather than number by
+# number. chunks run in a process pool and stream back in order, or as
+# they finish. chunk_size 0 cuts the range only where the number of digits
+# changes, for kernels whose cost does not grow with the width of a chunk.
+# the caller can stop early (close the generator, or set `cancel`), and
+# with a checkpoint file a long scan saves which chunks it has delivered,
+# so running the same scan again resumes where it stopped.
+# ---------------------------------------------------------------------------
+
+scan_chunk_size = 1 << 16
+scan_checkpoint_every = 5.0     # seconds between two checkpoint saves
+
+
+def scan_chunks(a, b, chunk_size):
+    lo = a
+    while lo <= b:
+        if chunk_size:
+            hi = min(lo + chunk_size, b + 1)
+        else:
+            hi = min(power_of_10(len(str(max(lo, 1)))), b + 1)
+        yield lo, hi
+        lo = hi
+
+
+def count_scan_chunks(a, b, chunk_size):
+    if b < a:
+        return 0
+    if chunk_size:
+        return -(-(b - a + 1) // chunk_size)
+    return len(str(max(b, 1))) - len(str(max(a, 1))) + 1
+
+
+def scan_chunk(kernel, lo, hi, count_only):
+    return lo, hi, kernel(lo, hi, count_only)
+
+
+# a kernel from a predicate on one number (both must be module-level
+# functions when the scan runs in a process pool):
+# functools.partial(predicate_kernel, predicate)
+def predicate_kernel(predicate, lo, hi, count_only=False):
+    found = filter(predicate, range(lo, hi))
+    return sum(1 for _ in found) if count_only else list(found)
+
+
+def kernel_name(kernel):
+    if isinstance(kernel, functools.partial):
+        return kernel_name(kernel.func) + "(" + ", ".join(map(kernel_name, kernel.args)) + ")"
+    return getattr(kernel, "__qualname__", repr(kernel))
+
+
+# which chunks of a scan have been delivered: everything below `next`, plus
+# the chunks in `done` (lo -> hi) that finished ahead of it. in count mode
+# it also keeps the running total.
+class ScanProgress:
+    def __init__(self, path, kernel, a, b, count_only, chunk_size):
+        self.path = path
+        self.scan = {"kernel": kernel_name(kernel), "a": a, "b": b, "count_only": count_only, "chunk_size": chunk_size}
+        self.next = a
+        self.done = {}
+        self.count = 0
+        self.saved = time.monotonic()
+        if path is not None and os.path.exists(path):
+            import json
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+            if state["scan"] != self.scan:
+                raise ValueError(f"checkpoint {path} belongs to a different scan")
+            self.next = state["next"]
+            self.done = {int(lo): hi for lo, hi in state["done"].items()}
+            self.count = state["count"]
+
+    def pending(self, lo):
+        return lo >= self.next and lo not in self.done
+
+    def mark(self, lo, hi, result):
+        if self.scan["count_only"]:
+            self.count += result
+        self.done[lo] = hi
+        while self.next in self.done:
+            self.next = self.done.pop(self.next)
+        if time.monotonic() - self.saved >= scan_checkpoint_every:
+            self.save()
+
+    def save(self):
+        if self.path is None:
+            return
+        import json
+        temp = self.path + ".tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump({"scan": self.scan, "next": self.next, "done": self.done, "count": self.count}, f)
+        os.replace(temp, self.path)
+        self.saved = time.monotonic()
+
+
+# (lo, hi, matches or count) for every chunk of [a, b] not delivered yet
+def range_scan(kernel, a, b, count_only=False, ordered=True, workers=None, chunk_size=None,
+               cancel=None, checkpoint=None, progress=None):
+    a = int(a)
+    b = int(b)
+    chunk_size = scan_chunk_size if chunk_size is None else int(chunk_size)
+    if progress is None:
+        progress = ScanProgress(checkpoint, kernel, a, b, count_only, chunk_size)
+    tasks = (
+        (kernel, lo, hi, count_only) for lo, hi in scan_chunks(a, b, chunk_size)
+        if progress.pending(lo) and not (cancel is not None and cancel.is_set())
+    )
+    if workers == 1 or count_scan_chunks(a, b, chunk_size) <= 1:
+        results = itertools.starmap(scan_chunk, tasks)
+    else:
+        results = bounded_map(scan_chunk, tasks, workers, ordered=ordered)
+    try:
+        for lo, hi, result in results:
+            if cancel is not None and cancel.is_set():
+                break
+            # a chunk counts as delivered once it is handed out, so a caller
+            # that stops after it does not get it again on resume
+            progress.mark(lo, hi, result)
+            yield lo, hi, result
+    finally:
+        if hasattr(results, "close"):
+            results.close()
+        progress.save()
+
+
+def scan_matches(kernel, a, b, **options):
+    for lo, hi, matches in range_scan(kernel, a, b, **options):
+        yield from matches
+
+
+# the total over [a, b], including what a resumed checkpoint had counted
+def scan_count(kernel, a, b, workers=None, chunk_size=None, cancel=None, checkpoint=None):
+    a = int(a)
+    b = int(b)
+    chunk_size = scan_chunk_size if chunk_size is None else int(chunk_size)
+    progress = ScanProgress(checkpoint, kernel, a, b, True, chunk_size)
+    for _ in range_scan(kernel, a, b, True, False, workers, chunk_size, cancel, progress=progress):
+        pass
+    return progress.count
+
+
+# kernels for the questions that look for numbers with a property. the
+# sparse ones (Armstrong, strong, Kaprekar) are searched directly, once per
+# digit length, and a chunk picks its numbers from the cached result.
+
+def matches_or_count(found, count_only):
+    return len(found) if count_only else found
+
+
+@functools.lru_cache(maxsize=None)
+def narcissistic_set(length):
+    return tuple(sorted(narcissistic_of_length(length))) if length <= max_narcissistic_length else ()
+
+
+@functools.lru_cache(maxsize=None)
+def kaprekar_set(length):
+    return tuple(kaprekar_numbers(length, length))
+
+
+def sparse_matches(table, lo, hi):
+    lo = max(lo, 1)
+    found = []
+    for length in range(len(str(lo)), len(str(max(hi - 1, 1))) + 1):
+        numbers = table(length)
+        found += numbers[bisect.bisect_left(numbers, lo):bisect.bisect_left(numbers, hi)]
+    return found
+
+
+# question 21: Armstrong numbers
+def armstrong_kernel(lo, hi, count_only=False):
+    return matches_or_count(sparse_matches(narcissistic_set, lo, hi), count_only)
+
+
+# question 23: multiples of 3 with a digit sum <= 10
+def div3_kernel(lo, hi, count_only=False):
+    if count_only:
+        return count_digit_numbers_between(lo, hi - 1, 3, 0, 10)
+    return list(iter_digit_numbers(lo, hi - 1, 3, 0, 10))
+
+
+# question 26: p with p and p + 2 both prime
+def twin_kernel(lo, hi, count_only=False):
+    return twin_primes_chunk(lo, hi, hi + 1, count_only)
+
+
+# question 27: Harshad numbers
+def harshad_kernel(lo, hi, count_only=False):
+    lo = max(lo, 1)
+    if count_only:
+        return count_harshad(hi - 1) - count_harshad(lo - 1) if hi > lo else 0
+    return list(iter_harshad(lo, hi - 1))
+
+
+@functools.lru_cache(maxsize=None)
+def strong_set(length):
+    return tuple(n for n in sorted(strong_numbers(10)) if len(str(n)) == length)
+
+
+# question 30: strong numbers
+def strong_kernel(lo, hi, count_only=False):
+    return matches_or_count(sparse_matches(strong_set, lo, hi), count_only)
+
+
+# numbers in [1, N] without a zero digit
+def count_zero_free(N):
+    if N < 1:
+        return 0
+    digits = str(N)
+    total = sum(9 ** L for L in range(1, len(digits)))
+    for i, c in enumerate(digits):
+        d = int(c)
+        if d == 0:
+            return total
+        total += (d - 1) * 9 ** (len(digits) - i - 1)
+    return total + 1
+
+
+# question 33: duck numbers (positive numbers with a zero digit)
+def duck_kernel(lo, hi, count_only=False):
+    lo = max(lo, 1)
+    if count_only:
+        return (hi - lo) - (count_zero_free(hi - 1) - count_zero_free(lo - 1)) if hi > lo else 0
+    numbers = range(lo, hi)
+    return list(itertools.compress(numbers, map(str.__contains__, map(str, numbers), itertools.repeat("0"))))
+
+
+# question 34: happy numbers
+def happy_kernel(lo, hi, count_only=False):
+    lo = max(lo, 1)
+    if hi <= lo:
+        return 0 if count_only else []
+    if count_only:
+        return count_happy_between(lo, hi - 1)
+    return list(itertools.compress(range(lo, hi), b"".join(happy_flags(lo, hi - 1))))
+
+
+# question 39: Kaprekar numbers
+def kaprekar_kernel(lo, hi, count_only=False):
+    return matches_or_count(sparse_matches(kaprekar_set, lo, hi), count_only)
+
+
+# question -> (kernel, chunk size for listing, chunk size for counting)
+range_kernels = {
+    21: (armstrong_kernel, 0, 0),
+    23: (div3_kernel, scan_chunk_size, 0),
+    26: (twin_kernel, twin_chunk_size, twin_chunk_size),
+    27: (harshad_kernel, scan_chunk_size, 0),
+    30: (strong_kernel, 0, 0),
+    33: (duck_kernel, scan_chunk_size, 0),
+    34: (happy_kernel, scan_chunk_size, 0),
+    39: (kaprekar_kernel, 0, 0),
+}
+
+
+# the matches of question q in [a, b], or their count
+def scan_question(question, a, b, count_only=False, **options):
+    kernel, list_chunk_size, count_chunk_size = range_kernels[int(question)]
+    if count_only:
+        return scan_count(kernel, a, b, chunk_size=count_chunk_size, **options)
+    return scan_matches(kernel, a, b, chunk_size=list_chunk_size, **options)
+
+
+# the same matches as (lo, hi, matches) chunks
+def scan_question_chunks(question, a, b, **options):
+    kernel, list_chunk_size, count_chunk_size = range_kernels[int(question)]
+    return range_scan(kernel, a, b, chunk_size=list_chunk_size, **options)
+
+
+# the "count" and "list" modes of the questions that check one number:
+# a range scan of [1, n], in this process unless workers is given
+def range_solver(question, n, mode, workers=1):
+    if mode == "count":
+        return scan_question(question, 1, n, True, workers=workers)
+    return list(scan_question(question, 1, n, workers=workers))
+
+
+def range_scan_main(question, a, b, count_only=False, ordered=True, workers=None, checkpoint=None):
+    try:
+        if count_only:
+            count = scan_question(question, a, b, True, workers=workers, checkpoint=checkpoint)
+            write_json_line({"question": int(question), "count": count})
+            return
+        # one write per chunk, so what the checkpoint records as delivered
+        # is what has been printed
+        for lo, hi, matches in scan_question_chunks(question, a, b, ordered=ordered, workers=workers,
+                                                    checkpoint=checkpoint):
+            sys.stdout.write("".join(f"{n}\n" for n in matches))
+    except KeyboardInterrupt:
+        if checkpoint:
+            sys.stderr.write(f"interrupted, progress saved to {checkpoint}\n")
+
+
+# ---------------------------------------------------------------------------
+# solvers: one function per question. They take the same values that the
+# interactive branches read with input() and return the answer instead of
+# printing it, so they can be used from the batch driver.
+# ---------------------------------------------------------------------------
+
+#1. positive, negative or zero
+def check_sign(c):
+    c = int(c)
     if(c>0):
-        print("no. is positive")
+        return "positive"
     elif(c<0):
-        print("no. is negative")
+        return "negative"
     else:
-        print("no. is zero")
+        return "zero"
 
-#2. Write a program to check whether a number is even or odd.
-elif(question_no == 2):
-    print("odd even checker")
-    c = int(input("enter no."))
+#2. even or odd
+def odd_even(c):
+    c = int(c)
     if(c%2==0):
-        print("even")
+        return "even"
     else:
-        print("odd")
-
-#3. Write a program to check if a given year is a leap year or not.
-elif(question_no == 3):
-    print("check if given year is a leap year")
-    c = int(input("year="))
-    if(c%4==0 or c%400==0):
-        print("its leap year")
-    else:
-        print("it is not leap year")
+        return "odd"
+
+#3. leap year
+def is_leap_year(c):
+    return is_gregorian_leap(int(c))
 
-#4. Write a program to find the greatest of two numbers.
-elif(question_no == 4):
-    print("which is the greatest no.")
-    c1 = int(input("1st number"))
-    c2 = int(input("2nd number"))
+#4. greatest of two numbers
+def greater_of_two(c1, c2):
+    c1 = int(c1)
+    c2 = int(c2)
     if(c1>c2):
-        print("1st no. is greater :")
+        return "first"
     elif(c2>c1):
-        print("2nd no. is greater :")
+        return "second"
     else:
-        print("both are same")
-
-#5. Write a program to check whether a person is eligible to vote (age >= 18).
-elif(question_no == 5):
-    print("to check person is eligible to vote ")
-    c = int(input("enter your age: "))
-    if(c>=18):
-        print("you are eligible to vote")
-    else:
-        print("not eligible")
+        return "same"
+
+#5. eligible to vote
+def can_vote(age):
+    return int(age) >= 18
 
-#6. Write a program to check whether a given character is a vowel or consonant.
-elif(question_no == 6):
-    print("to check given character is vowel or consonant ")
-    c = (input("enter character: "))
-    c = c.lower()
+#6. vowel or consonant
+def vowel_or_consonant(c):
+    c = str(c).lower()
     if(c=='a' or c=='e' or c=='i' or c=='o' or c=='u'):
-        print("entered character is vowel")
+        return "vowel"
     else:
-        print("entered character is consonant")
-
-#7. Write a program to check if a number is divisible by 5.
-elif(question_no == 7):
-    print("a program to check if a number is divisible by 5")
-    c = int(input("enter number: "))
-    if(c%5==0):
-        print(f"%s number is divisible by 5"%(c))
-    else:
-        print(f"%s number is not divisible by 5"%c)
+        return "consonant"
+
+#7. divisible by 5
+def divisible_by_5(c):
+    return int(c)%5==0
 
-#8. Write a program to determine whether a given number is a single-digit, two-digit, or more than two-digit number.
-elif(question_no == 8):
-    print(" a program to determine whether a given number is a single-digit, two-digit, or more than two-digit number")
-    c = int(input("enter number: "))
+#8. single-digit, two-digit or more
+def digit_class(c):
+    c = int(c)
     if(c<-99 or c>99):
-        print(f"%s is more than 2 digit number "%c)
+        return "more than two-digit"
     elif(c<-9 or c>9):
-        print(f"%s is  2 digit number "%c)
-    else:
-        print(f"%s is one digit number"%c)
-
-#9. Write a program to check whether a student has passed or failed (passing marks = 40).
-elif(question_no == 9):
-    print(" a program to check whether a student has passed or failed (passing marks = 40).")
-    c = int(input("enter your marks: "))
-    if(c >= 40):
-        print("hurray you passed the exam")
-    else:
-        print("Fail..")
-
-#10. Write a program to find whether the entered number is a multiple of both 3 and 7.
-elif(question_no == 10):
-    print("a program to find whether the entered number is a multiple of both 3 and 7.")
-    c = int(input("enter number: "))
-    if(c%3==0 and c%7==0):
-        print("the entered number is a multiple of both 3 and 7")
+        return "two-digit"
     else:
-        print("the entered number is not a multiple of both 3 and 7")
-
-#11. Write a program to find the greatest among three numbers.
-elif(question_no == 11):
-    print("a program to find the greatest among three numbers.")
-    a = int(input("a= "))
-    b = int(input("b= "))
-    c = int(input("c= "))
-
-    if(a>b and a>c):
-        print("%s is greatest"%a)
-    elif(b>a and b>c):
-        print(f"%s is greatest"%b)
-    else:
-        print(f"%s is greatest"%c)
-
-#12. Write a program to classify a person based on age: Child (<13), Teenager (13-19), Adult (20-59), Senior (60+).
-elif(question_no == 12):
-    print("a program to classify a person based on age: Child (<13), Teenager (13-19), Adult (20-59), Senior (60+).")
-    age = int(input("enter age: "))
-    if(age<13 and age>-1):
-        print("lalla ho tum abhi")
-    elif(age>=13 and age<=19):
-        print("teenager")
-    elif(age>19 and age <60):
-        print("")
-    
-
-#13 a program to assign grades based on marks
-elif(question_no == 13):
-    print("a program to assign grades based on marks")
-    marks = int(input("enter marks: "))
-    grade = '';
-    if(marks>89 and marks<101):
-        grade = 'A';
-        print(grade);
-    elif(marks>74 and marks<90):
-        grade = 'B'
-        print(grade)
-    elif(marks>49 and marks <75):
-        grade = 'C';
-        print(grade)
-    elif(marks>34 and marks<50):
-        grade = 'D'
-        print(grade)
-    elif(marks>-1 and marks<35):
-        grade = 'Fail'
-        print(grade)
-    else:
-        print("invalid marks")
-
-#14. Write a program to check the type of triangle (equilateral, isosceles, or scalene) based on sides. 
-elif(question_no == 14):
-    print("a program to check the type of triangle (equilateral, isosceles, or scalene) based on sides.")
-    side_a = int(input("length of side a = "))
-    side_b = int(input("length of side b = "))
-    side_c = int(input("length of side c = "))
+        return "single-digit"
+
+#9. passed or failed
+def has_passed(marks):
+    return int(marks) >= 40
+
+#10. multiple of both 3 and 7
+def multiple_of_3_and_7(c):
+    c = int(c)
+    return c%3==0 and c%7==0
+
+#11. and #31. greatest among three numbers (or more)
+def greatest_of_three(a, b, c, *more):
+    return select_values(list(map(int, (a, b, c) + more)), 0)["max"]
+
+#12. age group
+def age_group(age):
+    label = classify(int(age), "age")
+    if label is None:
+        raise ValueError("invalid age")
+    return label
+
+#13. grade from marks
+def grade(marks):
+    label = classify(int(marks), "grade")
+    if label is None:
+        raise ValueError("invalid marks")
+    return label
+
+#14. type of triangle
+def triangle_type(side_a, side_b, side_c):
+    side_a = int(side_a)
+    side_b = int(side_b)
+    side_c = int(side_c)
     if(side_a == side_b):
         if(side_a == side_c):
-            print("this is a equilateral triangle")
+            return "equilateral"
         else:
-            print("its an isosceles triangle")
+            return "isosceles"
     else:
         if(side_b == side_c):
-            print("its a isosceles triangle")
+            return "isosceles"
         else:
-            print("its a scalene triangle")
-
+            return "scalene"
 
-#15. Write a program to check if a character is uppercase, lowercase, digit, or special symbol.
-elif(question_no == 15):
-    print("a program to check if a character is uppercase, lowercase, digit, or special symbol.")
-    c = (input("enter character: "))
+#15. uppercase, lowercase, digit or symbol
+def char_type(c):
+    c = str(c)
     if(c.isalpha()):
         if(c.isupper()):
-            print("character is uppercase")
+            return "uppercase"
         else:
-            print("character is lowercase")
+            return "lowercase"
     else:
         if(c.isdigit()):
-            print("character is digit")
+            return "digit"
         else:
-            print("character is symbol")
-
-
-#16. Write a program to calculate electricity bill based on units: 
-#       Up to 100 units: ₹5 per unit, 
-#       101–200 units: ₹7 per unit, 
-#       Above 200 units: ₹10 per unit. 
-elif(question_no == 16):
-    print("a program to calculate electricity bill based on units.")
-    units = int(input("enter units :"))
-    bill = 0
-    if(units>200):                   #units = 1000       
-        bill = 10*(units-200)        #bill = 10*800
-        units = units-(units-200)    #units = 1000-(1000-200) = 200
-        bill = bill+(7*(units-100))  #bill = 8000+(7*(200-100)) = 8700 
-        units = units-100            #unit = 100
-        bill = bill+(5*units)        #bill = 8700+(5*100) = 9200
-        print("bill = ",bill)
+            return "symbol"
+
+#16. electricity bill
+def electricity_bill(units):
+    return slab_bill(int(units))
+
+#17. largest of four numbers (or more)
+def greatest_of_four(a, b, c, d, *more):
+    return select_values(list(map(int, (a, b, c, d) + more)), 0)["max"]
+
+#18. century year and also a leap year
+def is_century_leap_year(c):
+    return bool(year_flags(int(c)) & calendar_bits["century_leap"])
+
+#19. BMI class
+def bmi_class(BMI):
+    label = classify(float(BMI), "bmi")
+    if label is None:
+        raise ValueError("invalid BMI")
+    return label
+
+#20. smallest among three numbers (or more)
+def smallest_of_three(a, b, c, *more):
+    return select_values(list(map(int, (a, b, c) + more)), 0)["min"]
+
+#21. Armstrong numbers with min_length..max_length digits (3 by default)
+def armstrong_numbers(min_length=3, max_length=None):
+    min_length = int(min_length)
+    max_length = int(max_length or min_length)
+    return list(scan_question(21, power_of_10(min_length - 1), power_of_10(max_length) - 1))
+
+#22. first n prime numbers
+def first_n_primes(n):
+    return list(itertools.islice(iter_primes(), int(n)))
+
+#23. numbers from a to b (1 to 500 by default) divisible by 3 with sum of
+#    digits <= 10; mode "count" returns only how many there are
+def div3_digit_sum_le_10(a=1, b=500, mode="list"):
+    if mode == "count":
+        return scan_question(23, a, b, True)
+    return list(scan_question(23, a, b))
+
+#24. pyramid of stars
+def star_pyramid(n):
+    n = int(n)
+    return [" " * (n - i) + "*" * (2 * i - 1) for i in range(1, n + 1)]
+
+#25. pangram
+def is_pangram(s):
+    return letter_mask(str(s).encode("utf-8")) == full_letter_mask
+
+#26. twin primes in [a, b] (below 100 by default); mode "count" returns
+#    only how many pairs there are
+def twin_primes(a=1, b=100, mode="pairs"):
+    if mode == "count":
+        return count_twin_primes(a, b)
+    return list(twin_primes_between(a, b))
+
+#27. Harshad number; mode "count" returns how many Harshad numbers are <= num
+#    and mode "list" lists them
+def is_harshad(num, mode="check"):
+    num = int(num)
+    if mode in ("count", "list"):
+        return range_solver(27, num, mode)
+    if num <= 0:
+        raise ValueError("A Harshad number must be a positive integer.")
+    sum_of_digits = 0
+    for digit in str(num):
+        sum_of_digits += int(digit)
+    return num % sum_of_digits == 0
+
+#28. Pascal's triangle with n rows. mode "row" returns only row n and mode
+#    "entry" only C(n, k); mod (optional) reduces every number mod it
+def pascal_triangle(n, mode="triangle", k=0, mod=None):
+    n = int(n)
+    mod = int(mod) if mod else None
+    if mode == "row":
+        return pascal_row(n, mod)
+    if mode == "entry":
+        return pascal_entry(n, int(k), mod)
+    return list(pascal_rows(n, mod))
+
+#29. sum of the series 1² + 2² + ... + n² (or of any power k, optionally
+#    modulo mod)
+def sum_of_squares(n, k=2, mod=None):
+    return power_sum(int(n), int(k), int(mod) if mod else None)
+
+#30. Strong number (optionally in another base from 2 to 16); in base 10,
+#    mode "count" or "list" gives the strong numbers <= num
+def is_strong(num, base=10, mode="check"):
+    num = int(num)
+    base = int(base)
+    if mode in ("count", "list"):
+        if base != 10:
+            raise ValueError("count and list work in base 10 only")
+        return range_solver(30, num, mode)
+    if base == 10:
+        return are_strong([num])[0]
+    return num >= 0 and sum(factorials[d] for d in to_digits(num, base)) == num
+
+#32. how many numbers until the sum of their digits is > 100
+#    (None if the numbers given never get there)
+def digit_sum_over_100(*nums):
+    total_digit_sum = 0
+    num_count = 0
+    for num in nums:
+        total_digit_sum += number_digit_sum(num)
+        num_count += 1
+        if total_digit_sum > 100:
+            return num_count
+    return None
+
+#33. Duck number; mode "count" or "list" gives the duck numbers <= num_str
+def is_duck(num_str, mode="check"):
+    if mode in ("count", "list"):
+        return range_solver(33, int(num_str), mode)
+    num_str = str(num_str)
+    if num_str.startswith('0'):
+        raise ValueError("A Duck number cannot start with zero.")
+    return '0' in num_str
+
+#34. Happy number; mode "count" returns how many happy numbers are <= num
+#    and mode "list" lists them
+def is_happy(num, mode="check"):
+    if mode in ("count", "list"):
+        return range_solver(34, int(num), mode)
+    return is_happy_number(num)
+
+#35. largest prime factor (-1 when n has none)
+def largest_prime_factor(n):
+    n = int(n)
+    if n < 2:
+        return -1
+    return factorize(n)[-1]
+
+#36. palindrome string; mode "longest" returns the longest palindromic
+#    substring instead
+def is_palindrome(s, mode="check"):
+    s = str(s)
+    if mode == "longest":
+        start, length = longest_palindrome(s)
+        return s[start:start + length]
+    return is_palindrome_buffer(s)
+
+#37. digital root (of a non-negative number; given as text it may have
+#    any number of digits)
+def digital_root(num):
+    if str(num).strip().startswith("-"):
+        raise ValueError("digital root needs a non-negative number")
+    return digital_root_of_sum(number_digit_sum(num))
+
+#38. Collatz sequence. mode "steps" returns only the stopping time, and
+#    mode "range" the start in [1, n] with the longest chain and its length
+def collatz_sequence(n, mode="sequence"):
+    if mode == "steps":
+        return stopping_time(n)
+    if mode == "range":
+        return longest_collatz(n)
+    return list(collatz_trajectory(n))
+
+#39. Kaprekar number; mode "count" or "list" gives the Kaprekar numbers <= n
+def is_kaprekar(n, mode="check"):
+    n = int(n)
+    if mode in ("count", "list"):
+        return range_solver(39, n, mode)
+    if n <= 0:
+        return False
+    square = n * n
+    m = 1
+    while power_of_10(m) <= square:
+        part1, part2 = divmod(square, powers_of_10[m])
+        if part2 != 0 and part1 + part2 == n:
+            return True
+        m += 1
+    return False
+
+#40. ATM: replays the menu choices (and amounts) that would be typed at the
+#    prompts against a fresh in-memory account and returns the final balance
+def atm_session(*inputs):
+    ledger = Ledger(opening_balance=atm_opening_balance)
+    inputs = iter(inputs)
+    for choice in inputs:
+        choice = str(choice)
+        if choice == '2':
+            ledger.deposit("default", to_cents(next(inputs)))
+        elif choice == '3':
+            cents = to_cents(next(inputs))
+            if ledger.balance("default") >= cents:
+                ledger.withdraw("default", cents)
+        elif choice == '4':
+            break
+        elif choice != '1':
+            raise ValueError("Invalid choice. Please enter a number from 1 to 4.")
+    return format_cents(ledger.balance("default"))
+
+solvers = {
+    1: check_sign,
+    2: odd_even,
+    3: is_leap_year,
+    4: greater_of_two,
+    5: can_vote,
+    6: vowel_or_consonant,
+    7: divisible_by_5,
+    8: digit_class,
+    9: has_passed,
+    10: multiple_of_3_and_7,
+    11: greatest_of_three,
+    12: age_group,
+    13: grade,
+    14: triangle_type,
+    15: char_type,
+    16: electricity_bill,
+    17: greatest_of_four,
+    18: is_century_leap_year,
+    19: bmi_class,
+    20: smallest_of_three,
+    21: armstrong_numbers,
+    22: first_n_primes,
+    23: div3_digit_sum_le_10,
+    24: star_pyramid,
+    25: is_pangram,
+    26: twin_primes,
+    27: is_harshad,
+    28: pascal_triangle,
+    29: sum_of_squares,
+    30: is_strong,
+    31: greatest_of_three,
+    32: digit_sum_over_100,
+    33: is_duck,
+    34: is_happy,
+    35: largest_prime_factor,
+    36: is_palindrome,
+    37: digital_root,
+    38: collatz_sequence,
+    39: is_kaprekar,
+    40: atm_session,
+}
+
+
+# ---------------------------------------------------------------------------
+# batch mode: records are read one at a time from a JSONL or CSV stream, so
+# memory use does not depend on the size of the input.
+#   JSONL: {"question": 22, "args": [10]}   (args may also be a dict)
+#   CSV:   22,10                            (question followed by the args)
+# the args are the same values that would be typed at the prompts.
+# ---------------------------------------------------------------------------
+
+def read_records(stream, fmt="jsonl"):
+    import csv
+    import json
+    if fmt == "csv":
+        for row in csv.reader(stream):
+            if not row or row[0].strip().lower() == "question":
+                continue
+            yield {"question": row[0], "args": row[1:]}
     else:
-        if(units<101):
-            bill = 5*units
-            print("bill = ",bill)
-        else:
-            bill = 5*(100) 
-            units = units - 100
-            bill = bill+(7*units)
-            print("bill = ",bill)
-
-#17. Write a program to determine the largest of four numbers using nested if. 
-elif(question_no == 17):
-    print("a program to determine the largest of four numbers using nested if.")
-    a = int(input("enter a = "))
-    b = int(input("enter b = "))
-    c = int(input("enter c = "))
-    d = int(input("enter d = "))
-    if(a>b):
-        if(a>c):
-            if(a>d):
-                print(f"%s is greatest"%a)
+        for line in stream:
+            line = line.strip()
+            if line:
+                # a line that is not JSON is passed on as its error, so it
+                # fails on its own instead of ending the run
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    record = e
+                yield record
+
+
+def call_solver(solver, args):
+    if isinstance(args, dict):
+        return solver(**args)
+    return solver(*args)
+
+
+def solve(question, args=()):
+    question = int(question)
+    solver = solvers.get(question)
+    if solver is None:
+        raise ValueError("Entered question no. does not exist")
+    if result_cache is None or question not in cached_questions:
+        return call_solver(solver, args)
+    key = result_cache_key(question, args)
+    found, result = result_cache.get(key)
+    if not found:
+        result = result_cache.put(key, call_solver(solver, args))
+    return result
+
+
+def solve_record(record):
+    result = {}
+    try:
+        if isinstance(record, Exception):
+            raise record
+        result["question"] = int(record["question"])
+        result["result"] = solve(record["question"], record.get("args", ()))
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+# a list of records at once (what a process pool worker gets)
+def solve_records(records):
+    return list(map(solve_record, records))
+
+
+def run_batch(records):
+    for index, record in enumerate(records):
+        yield {"index": index, **solve_record(record)}
+
+
+# solves every record once so the answers are in the cache, and returns
+# how many of them failed
+def warm_cache(records):
+    return sum("error" in solve_record(record) for record in records)
+
+
+def open_records(path, fmt=None):
+    if fmt is None:
+        fmt = "csv" if path.lower().endswith(".csv") else "jsonl"
+    return sys.stdin if path == "-" else open(path, newline="", encoding="utf-8"), fmt
+
+
+def warm_cache_main(path, fmt=None, cache_path=None, ttl=None):
+    cache = enable_result_cache(cache_path or result_cache_path, ttl)
+    stream, fmt = open_records(path, fmt)
+    try:
+        errors = warm_cache(read_records(stream, fmt))
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    write_json_line({"errors": errors, **cache.stats()})
+    disable_result_cache()
+
+
+def batch_main(path, fmt=None):
+    stream, fmt = open_records(path, fmt)
+    try:
+        for result in run_batch(read_records(stream, fmt)):
+            write_json_line(result)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    if result_cache is not None:
+        write_json_line(result_cache.stats(), sys.stderr)
+
+
+# ---------------------------------------------------------------------------
+# HTTP/JSON service (run with --serve). POST {"question": n, "args": [...]}
+# to any path and the answer comes back as {"question": n, "result": ...},
+# or {"error": ...} with status 400; GET lists the question numbers.
+# connections are kept alive. every request goes through one bounded queue:
+# a dispatcher takes what has arrived within serve_batch_window, groups it
+# by question and answers each group in one go, the few cheap questions on
+# the event loop and everything else in a process pool (one round trip
+# per group).
+# when the queue is full the handlers stop reading from their sockets until
+# there is room, so a flood of clients is slowed down instead of buffered.
+# ---------------------------------------------------------------------------
+
+serve_host = "127.0.0.1"
+serve_port = 8040
+serve_queue_size = 1024
+serve_batch_window = 0.001      # seconds to wait for more requests to join a batch
+serve_batch_size = 256
+serve_max_body = 1 << 20
+# the questions cheap enough for the event loop whatever the arguments (a
+# request body is at most serve_max_body); everything else, and any of
+# these asked in one of the heavy modes, goes to the process pool
+light_questions = frozenset(range(1, 21)) | {25, 31, 32, 33, 36, 37}
+heavy_modes = frozenset({"count", "list", "range", "longest"})
+http_reasons = {200: "OK", 400: "Bad Request", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+def is_heavy(record):
+    if record["question"] not in light_questions:
+        return True
+    args = record["args"]
+    values = args.values() if isinstance(args, dict) else args
+    return any(isinstance(value, str) and value.strip().lower() in heavy_modes for value in values)
+
+
+# "host:port" or "port" -> (host, port)
+def parse_address(text):
+    host, _, port = str(text).rpartition(":")
+    return host or serve_host, int(port)
+
+
+# (start line split into words, headers, body) of the next HTTP message,
+# or None when the peer has closed the connection
+async def read_http_message(reader):
+    start_line = await reader.readline()
+    if not start_line:
+        return None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if not line.strip():
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise ValueError("Content-Length is not a number") from None
+    if length < 0:
+        raise ValueError("Content-Length is negative")
+    if length > serve_max_body:
+        raise OverflowError("request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return start_line.decode("latin-1").split(), headers, body
+
+
+def http_response(status, payload, keep_alive=True):
+    import json
+    body = json.dumps(payload).encode()
+    head = (f"HTTP/1.1 {status} {http_reasons[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode() + body
+
+
+class SolverServer:
+    def __init__(self, workers=None, queue_size=None):
+        import asyncio
+        from concurrent.futures import ProcessPoolExecutor
+        workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.pending = asyncio.Queue(queue_size or serve_queue_size)
+        self.pool_slots = asyncio.Semaphore(2 * workers)
+        self.tasks = set()
+
+    async def submit(self, record):
+        import asyncio
+        future = asyncio.get_running_loop().create_future()
+        await self.pending.put((record, future))
+        return await future
+
+    async def dispatch(self):
+        import asyncio
+        while True:
+            batch = [await self.pending.get()]
+            if serve_batch_window and self.pending.empty():
+                await asyncio.sleep(serve_batch_window)
+            while len(batch) < serve_batch_size and not self.pending.empty():
+                batch.append(self.pending.get_nowait())
+            groups = collections.defaultdict(list)
+            for item in batch:
+                groups[item[0]["question"], is_heavy(item[0])].append(item)
+            for (_, heavy), items in groups.items():
+                if heavy:
+                    task = asyncio.create_task(self.solve_in_pool(items))
+                    self.tasks.add(task)
+                    task.add_done_callback(self.tasks.discard)
+                else:
+                    self.answer(items, solve_records([record for record, future in items]))
+
+    async def solve_in_pool(self, items):
+        import asyncio
+        records = [record for record, future in items]
+        # waiting for a slot here, not in dispatch, so a full pool only holds
+        # up heavy requests and the light ones keep being answered
+        async with self.pool_slots:
+            try:
+                results = await asyncio.get_running_loop().run_in_executor(self.pool, solve_records, records)
+            except Exception as e:
+                results = [{"question": record["question"], "error": f"{type(e).__name__}: {e}"} for record in records]
+        self.answer(items, results)
+
+    def answer(self, items, results):
+        for (record, future), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def respond(self, method, body):
+        import json
+        if method == "GET":
+            return 200, {"questions": sorted(solvers)}
+        if method != "POST":
+            return 405, {"error": "use POST with a JSON body"}
+        try:
+            request = json.loads(body)
+            record = {"question": int(request["question"]), "args": request.get("args", [])}
+            if not isinstance(record["args"], (list, dict)):
+                raise TypeError("args must be a list or an object")
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            return 400, {"error": f"{type(e).__name__}: {e}"}
+        result = await self.submit(record)
+        return (400 if "error" in result else 200), result
+
+    async def handle(self, reader, writer):
+        import asyncio
+        try:
+            while True:
+                try:
+                    message = await read_http_message(reader)
+                except (ValueError, OverflowError) as e:
+                    status = 413 if isinstance(e, OverflowError) else 400
+                    writer.write(http_response(status, {"error": str(e)}, keep_alive=False))
+                    break
+                if message is None or len(message[0]) < 3:
+                    break
+                (method, _, version), headers, body = message[0][:3], message[1], message[2]
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+                status, payload = await self.respond(method, body)
+                writer.write(http_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            # a dropped client, or the server shutting down
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        for task in self.tasks:
+            task.cancel()
+        self.pool.shutdown(cancel_futures=True)
+
+
+# runs until cancelled; `started` (a future) gets the bound (host, port)
+async def serve(host=serve_host, port=serve_port, workers=None, started=None):
+    import asyncio
+    server = SolverServer(workers)
+    dispatcher = asyncio.create_task(server.dispatch())
+    try:
+        # fork the pool workers before any connection is accepted; a worker
+        # forked later inherits the open client sockets and keeps them open
+        # after the server has closed its end
+        await asyncio.get_running_loop().run_in_executor(server.pool, int)
+        listener = await asyncio.start_server(server.handle, host, port)
+        async with listener:
+            address = listener.sockets[0].getsockname()[:2]
+            if started is not None:
+                started.set_result(address)
             else:
-                print(f"%s is greatest"%d)
+                sys.stderr.write(f"serving on http://{address[0]}:{address[1]}\n")
+            await listener.serve_forever()
+    finally:
+        dispatcher.cancel()
+        server.close()
+
+
+def serve_main(address, workers=None):
+    import asyncio
+    host, port = parse_address(address)
+    try:
+        asyncio.run(serve(host, port, workers))
+    except KeyboardInterrupt:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# load generator for the service: `connections` keep-alive clients send
+# `requests` requests in total, drawn from a mix of cheap and heavy
+# questions, and the throughput and latency percentiles are reported.
+# ---------------------------------------------------------------------------
+
+load_mix = (
+    {"question": 3, "args": [1900]},
+    {"question": 12, "args": [42]},
+    {"question": 16, "args": [250]},
+    {"question": 29, "args": [10**12]},
+    {"question": 35, "args": [600851475143]},
+    {"question": 39, "args": [297]},
+    {"question": 26, "args": [1, 10**5, "count"]},
+)
+
+
+async def load_client(host, port, records, latencies):
+    import asyncio
+    import json
+    errors = 0
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for record in records:
+            body = json.dumps(record).encode()
+            start = time.perf_counter()
+            writer.write(f"POST /solve HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                         f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+            await writer.drain()
+            message = await read_http_message(reader)
+            latencies.append(time.perf_counter() - start)
+            if message is None:
+                raise ConnectionError("server closed the connection")
+            if message[0][1] != "200":
+                errors += 1
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    return errors
+
+
+async def load(host=serve_host, port=serve_port, connections=32, requests=2000, mix=load_mix, seed=0):
+    import asyncio
+    import random
+    rng = random.Random(seed)
+    records = [rng.choice(mix) for _ in range(requests)]
+    latencies = []
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(
+        load_client(host, port, records[i::connections], latencies) for i in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+    }
+
+
+def print_load_report(report, connections):
+    print(f"{report['requests']} requests ({report['errors']} errors) over {connections} connections "
+          f"in {report['seconds']:.2f}s")
+    print(f"throughput: {report['throughput']:.0f} req/s")
+    print(f"latency p50: {report['p50_ms']:.2f} ms  p99: {report['p99_ms']:.2f} ms")
+
+
+def load_main(address, connections=32, requests=2000):
+    import asyncio
+    host, port = parse_address(address)
+    print_load_report(asyncio.run(load(host, port, connections, requests)), connections)
+
+
+def interactive():
+    print("Name - Piyush Kushwaha")
+    print("Enrollment no. - 0157CY231079")
+    print("Batch - 5")
+    print("Batch time - 10:30\n")
+    print("question numbers range is from 1 to 40")
+    question_no = int(input("enter question no."))
+    #1. Write a program to check whether a number is positive, negative, or zero.
+    if(question_no == 1):
+        print("check for +ve,-ve or zero")
+        c = int(input("enter no."))
+        print("no. is " + check_sign(c))
+
+    #2. Write a program to check whether a number is even or odd.
+    elif(question_no == 2):
+        print("odd even checker")
+        c = int(input("enter no."))
+        print(odd_even(c))
+
+    #3. Write a program to check if a given year is a leap year or not.
+    elif(question_no == 3):
+        print("check if given year is a leap year")
+        c = int(input("year="))
+        if(is_leap_year(c)):
+            print("its leap year")
         else:
-            if(c>d):
-                print(f"%s is greatest"%c)
-            else:
-                print(f"%s is greatest"%d)
-
-    else:
-        if(b>c):
-            if(b>d):
-                print(f"%s is greatest"%b)
-            else:
-                print(f"%s is greatest"%d)
+            print("it is not leap year")
+
+    #4. Write a program to find the greatest of two numbers.
+    elif(question_no == 4):
+        print("which is the greatest no.")
+        c1 = int(input("1st number"))
+        c2 = int(input("2nd number"))
+        greater = greater_of_two(c1, c2)
+        if(greater == "first"):
+            print("1st no. is greater :")
+        elif(greater == "second"):
+            print("2nd no. is greater :")
         else:
-            if(c>d):
-                print(f"%s is greatest"%c)
-            else:
-                print(f"%s is greatest"%d)
-
-#18. Write a program to check if a given year is a century year and also a leap year. 
-elif(question_no == 18):
-    print("a program to check if a given year is a century year and also a leap year.")
-    c = int(input("year="))
-    if(c%400==0):
-        print("its century year and also a leap year.")
-    else:
-        print("it is not century year and also a leap year.")
-
-#19. Write a program to classify BMI value: Underweight (<18.5), Normal (18.5-24.9), Overweight (25-29.9), Obese (30+). 
-elif(question_no == 19):
-    print("a program to classify BMI value: Underweight (<18.5), Normal (18.5-24.9), Overweight (25-29.9), Obese (30+). ")
-    BMI = float(input("Enter BMI: "))
-    if(BMI<30):
-        if(BMI<25):
-            if(BMI<18.5 and BMI>=0):
-                print("Underweight")
-            else:
-                print("Normal")
+            print("both are same")
+
+    #5. Write a program to check whether a person is eligible to vote (age >= 18).
+    elif(question_no == 5):
+        print("to check person is eligible to vote ")
+        c = int(input("enter your age: "))
+        if(can_vote(c)):
+            print("you are eligible to vote")
         else:
-            print("Overweight")
-    else:
-        print("Obese")
-
-#20. Write a program to display the smallest number among three using nested if.
-elif(question_no == 20):
-    print("a program to display the smallest number among three using nested if.")
-    a = int(input("enter a= "))
-    b = int(input("enter b= "))
-    c = int(input("enter c= "))
-    if(a>b):
-        if(a>c):
-            print(f"%s is greatest"%a)
+            print("not eligible")
+
+    #6. Write a program to check whether a given character is a vowel or consonant.
+    elif(question_no == 6):
+        print("to check given character is vowel or consonant ")
+        c = (input("enter character: "))
+        print("entered character is " + vowel_or_consonant(c))
+
+    #7. Write a program to check if a number is divisible by 5.
+    elif(question_no == 7):
+        print("a program to check if a number is divisible by 5")
+        c = int(input("enter number: "))
+        if(divisible_by_5(c)):
+            print(f"%s number is divisible by 5"%(c))
         else:
-            print(f"%s is greatest"%c)
-    else:
-        if(b>c):
-            print(f"%s is greatest"%b)
+            print(f"%s number is not divisible by 5"%c)
+
+    #8. Write a program to determine whether a given number is a single-digit, two-digit, or more than two-digit number.
+    elif(question_no == 8):
+        print(" a program to determine whether a given number is a single-digit, two-digit, or more than two-digit number")
+        c = int(input("enter number: "))
+        kind = digit_class(c)
+        if(kind == "more than two-digit"):
+            print(f"%s is more than 2 digit number "%c)
+        elif(kind == "two-digit"):
+            print(f"%s is  2 digit number "%c)
         else:
-            print(f"%s is greatest"%c)
-
-#21. Write a program using a for loop to print all Armstrong numbers between 100 and 999. (Armstrong number: 
-#    sum of cubes of digits equals the number itself. Example: 153 => 1³+5³+3³ = 153). 
-elif(question_no == 21):
-    print("a program using a for loop to print all Armstrong numbers between 100 and 999.")
-    for a in range(100,999):
-        d = (a%10)
-        e = ((a//10)%10)
-        f = ((a//100)%10)
-        c = (d**3)+(e**3)+(f**3)
-        if(c==a):
-            print(f"%s "%a)
-
-#22. Write a program to generate and display the first n prime numbers using a for loop.
-elif(question_no == 22):
-    print("a program to generate and display the first n prime numbers using a for loop.")
-    n = int(input("enter number= "))
-    prime = [1]
-    for num in (range(2,n)):
-        j = 2
-        for i in range(2,num):
-            if(num%i==0):
-                break
-            j=j+1
-        prime.append(j)
-    li = set(prime)
-    li = sorted(li)
-    print(li)
-
-
-#23: Numbers from 1 to 500 divisible by 3 with sum of digits <= 10.
-elif(question_no == 23):
-    print("23. Numbers divisible by 3 with a digit sum <= 10:")
-    found_numbers = []
-    for num in range(1, 501):
-        if num % 3 == 0:
-            # Calculate the sum of digits
-            sum_of_digits = sum(int(digit) for digit in str(num))
-            if sum_of_digits <= 10:
-                found_numbers.append(num)
-    print(found_numbers)
-
-#24: Pyramid of stars.
-elif(question_no == 24):
-    print(f"24. Star pyramid of height {n}:")
-    n = int(input("enter n: "))
-    for i in range(1, n + 1):
-        spaces = " " * (n - i)
-        stars = "*" * (2 * i - 1)
-        print(spaces + stars)
-
-#25: Pangram checker.
-elif(question_no == 25):
-    print(f"25. Checking if string is a pangram:")
-    s = input("enter string: ")
-    s = s.lower()
-    alphabet = "abcdefghijklmnopqrstuvwxyz"
-    is_pangram_status = True
-    for char in alphabet:
-        if char not in s:
-            is_pangram_status = False
-            break
-    
-    if is_pangram_status:
-        print("The string is a pangram.")
-    else:
-        print("The string is not a pangram.")
-
-#26: Twin primes.
-elif(question_no == 26):
-    print("Twin primes")
-    twin_primes = []
-    for num in range(1,100):
-        # Check if num is prime
-        is_prime1 = True
-        if num <= 1:
-            is_prime1 = False
+            print(f"%s is one digit number"%c)
+
+    #9. Write a program to check whether a student has passed or failed (passing marks = 40).
+    elif(question_no == 9):
+        print(" a program to check whether a student has passed or failed (passing marks = 40).")
+        c = int(input("enter your marks: "))
+        if(has_passed(c)):
+            print("hurray you passed the exam")
         else:
-            for i in range(2, int(num**0.5) + 1):
-                if num % i == 0:
-                    is_prime1 = False
-                    break
-    
-        # Check if num + 2 is prime
-        is_prime2 = True
-        num2 = num + 2
-        if num2 <= 1:
-            is_prime2 = False
+            print("Fail..")
+
+    #10. Write a program to find whether the entered number is a multiple of both 3 and 7.
+    elif(question_no == 10):
+        print("a program to find whether the entered number is a multiple of both 3 and 7.")
+        c = int(input("enter number: "))
+        if(multiple_of_3_and_7(c)):
+            print("the entered number is a multiple of both 3 and 7")
         else:
-            for i in range(2, int(num2**0.5) + 1):
-                if num2 % i == 0:
-                    is_prime2 = False
-                    break
-
-        if is_prime1 and is_prime2:
-            twin_primes.append((num, num + 2))
-
-    print(twin_primes)
+            print("the entered number is not a multiple of both 3 and 7")
+
+    #11. Write a program to find the greatest among three numbers.
+    elif(question_no == 11):
+        print("a program to find the greatest among three numbers.")
+        a = int(input("a= "))
+        b = int(input("b= "))
+        c = int(input("c= "))
+
+        print("%s is greatest"%greatest_of_three(a, b, c))
+
+    #12. Write a program to classify a person based on age: Child (<13), Teenager (13-19), Adult (20-59), Senior (60+).
+    elif(question_no == 12):
+        print("a program to classify a person based on age: Child (<13), Teenager (13-19), Adult (20-59), Senior (60+).")
+        age = int(input("enter age: "))
+        print(classify(age, "age") or "invalid age")
+
+    #13 a program to assign grades based on marks
+    elif(question_no == 13):
+        print("a program to assign grades based on marks")
+        marks = int(input("enter marks: "))
+        print(classify(marks, "grade") or "invalid marks")
+
+    #14. Write a program to check the type of triangle (equilateral, isosceles, or scalene) based on sides. 
+    elif(question_no == 14):
+        print("a program to check the type of triangle (equilateral, isosceles, or scalene) based on sides.")
+        side_a = int(input("length of side a = "))
+        side_b = int(input("length of side b = "))
+        side_c = int(input("length of side c = "))
+        kind = triangle_type(side_a, side_b, side_c)
+        if(kind == "equilateral"):
+            print("this is a equilateral triangle")
+        elif(kind == "isosceles"):
+            print("its an isosceles triangle")
+        else:
+            print("its a scalene triangle")
 
-#27: Harshad number checker.
-elif(question_no == 27):
-    print("27. Checking if number is a Harshad number:")
-    num = int(input("enter number: "))
-    if num <= 0:
-        print("A Harshad number must be a positive integer.")
-        
-    else:
-        sum_of_digits = 0
-        # Use a for loop to iterate through the digits of the number
-        for digit in str(num):
-            sum_of_digits += int(digit)
 
-        if num % sum_of_digits == 0:
-            print(f"{num} is a Harshad number.")
+    #15. Write a program to check if a character is uppercase, lowercase, digit, or special symbol.
+    elif(question_no == 15):
+        print("a program to check if a character is uppercase, lowercase, digit, or special symbol.")
+        c = (input("enter character: "))
+        print("character is " + char_type(c))
+
+
+    #16. Write a program to calculate electricity bill based on units: 
+    #       Up to 100 units: ₹5 per unit, 
+    #       101–200 units: ₹7 per unit, 
+    #       Above 200 units: ₹10 per unit. 
+    elif(question_no == 16):
+        print("a program to calculate electricity bill based on units.")
+        units = int(input("enter units :"))
+        print("bill = ",electricity_bill(units))
+
+    #17. Write a program to determine the largest of four numbers using nested if. 
+    elif(question_no == 17):
+        print("a program to determine the largest of four numbers using nested if.")
+        a = int(input("enter a = "))
+        b = int(input("enter b = "))
+        c = int(input("enter c = "))
+        d = int(input("enter d = "))
+        print("%s is greatest"%greatest_of_four(a, b, c, d))
+
+    #18. Write a program to check if a given year is a century year and also a leap year. 
+    elif(question_no == 18):
+        print("a program to check if a given year is a century year and also a leap year.")
+        c = int(input("year="))
+        if(is_century_leap_year(c)):
+            print("its century year and also a leap year.")
         else:
-            print(f"{num} is not a Harshad number.")
+            print("it is not century year and also a leap year.")
+
+    #19. Write a program to classify BMI value: Underweight (<18.5), Normal (18.5-24.9), Overweight (25-29.9), Obese (30+). 
+    elif(question_no == 19):
+        print("a program to classify BMI value: Underweight (<18.5), Normal (18.5-24.9), Overweight (25-29.9), Obese (30+). ")
+        BMI = float(input("Enter BMI: "))
+        print(classify(BMI, "bmi") or "invalid BMI")
+
+    #20. Write a program to display the smallest number among three using nested if.
+    elif(question_no == 20):
+        print("a program to display the smallest number among three using nested if.")
+        a = int(input("enter a= "))
+        b = int(input("enter b= "))
+        c = int(input("enter c= "))
+        print("%s is smallest"%smallest_of_three(a, b, c))
+
+    #21. Write a program using a for loop to print all Armstrong numbers between 100 and 999. (Armstrong number: 
+    #    sum of cubes of digits equals the number itself. Example: 153 => 1³+5³+3³ = 153). 
+    elif(question_no == 21):
+        print("a program using a for loop to print all Armstrong numbers between 100 and 999.")
+        length = int(input("enter number of digits (1-39, blank for 3): ") or 3)
+        for a in armstrong_numbers(length):
+            print(f"%s "%a)
 
-#88: Pascal's Triangle.
-elif(question_no == 28):
-    n = int(input("enter no.  of rows: "))
-    print(f"28. Pascal's Triangle up to n rows:")
-    triangle = []
-    for i in range(n):
-        row = [1] * (i + 1)
-        if i > 1:
-            for j in range(1, i):
-                row[j] = triangle[i - 1][j - 1] + triangle[i - 1][j]
-        triangle.append(row)
-
-    # Print the triangle
-    for row in triangle:
-        print(" ".join(map(str, row)).center(n * 3))
-
-#29: Sum of series 1² + 2² + ... + n².
-elif(question_no == 29):
-    print(f"29. Sum of the series 1² + 2² + ... + n²:")
-    n = int(input("enter n: "))
-    total_sum = 0
-    for i in range(1, n + 1):
-        total_sum += i ** 2
-    
-    print(f"The sum is: {total_sum}")
+    #22. Write a program to generate and display the first n prime numbers using a for loop.
+    elif(question_no == 22):
+        print("a program to generate and display the first n prime numbers using a for loop.")
+        n = int(input("enter number= "))
+        # streamed straight from the sieve, so even a large n never holds
+        # the whole list in memory
+        for p in itertools.islice(iter_primes(), n):
+            sys.stdout.write(f"{p} ")
+        sys.stdout.write("\n")
+
+
+    #23: Numbers from 1 to 500 divisible by 3 with sum of digits <= 10.
+    elif(question_no == 23):
+        print("23. Numbers divisible by 3 with a digit sum <= 10:")
+        print(div3_digit_sum_le_10())
+
+    #24: Pyramid of stars.
+    elif(question_no == 24):
+        n = int(input("enter n: "))
+        print(f"24. Star pyramid of height {n}:")
+        for row in star_pyramid(n):
+            print(row)
+
+    #25: Pangram checker.
+    elif(question_no == 25):
+        print(f"25. Checking if string is a pangram:")
+        s = input("enter string: ")
+        if is_pangram(s):
+            print("The string is a pangram.")
+        else:
+            print("The string is not a pangram.")
+
+    #26: Twin primes.
+    elif(question_no == 26):
+        print("Twin primes")
+        a = int(input("enter start of range: "))
+        b = int(input("enter end of range: "))
+        for pair in twin_primes_between(a, b):
+            sys.stdout.write(f"{pair} ")
+        sys.stdout.write("\n")
+
+    #27: Harshad number checker.
+    elif(question_no == 27):
+        print("27. Checking if number is a Harshad number:")
+        num = int(input("enter number: "))
+        if num <= 0:
+            print("A Harshad number must be a positive integer.")
 
+        else:
+            if is_harshad(num):
+                print(f"{num} is a Harshad number.")
+            else:
+                print(f"{num} is not a Harshad number.")
 
-#30: Strong number checker.
-elif(question_no == 30):
-    print("30. Strong number checker.")
-    num = int(input(".Enter a number to check if it's a Strong number: "))
+    #88: Pascal's Triangle.
+    elif(question_no == 28):
+        n = int(input("enter no.  of rows: "))
+        print(f"28. Pascal's Triangle up to n rows:")
+        write_pascal_rows(n)
 
+    #29: Sum of series 1² + 2² + ... + n².
+    elif(question_no == 29):
+        print(f"29. Sum of the series 1² + 2² + ... + n²:")
+        n = int(input("enter n: "))
+        total_sum = sum_of_squares(n)
 
-    print(f"Checking if {num} is a Strong number:")
-    original_num = num
-    sum_of_factorials = 0
+        print(f"The sum is: {total_sum}")
 
-    for digit_char in str(num):
-        digit = int(digit_char)
-        # Inline factorial calculation
-        fact = 1
-        if digit == 0:
-            fact = 1
-        else:
-            for i in range(1, digit + 1):
-                fact *= i
-        sum_of_factorials += fact
 
-    if sum_of_factorials == original_num:
-        print(f"{original_num} is a Strong number.")
-    else:
-        print(f"{original_num} is not a Strong number.")
+    #30: Strong number checker.
+    elif(question_no == 30):
+        print("30. Strong number checker.")
+        num = int(input(".Enter a number to check if it's a Strong number: "))
 
 
-#31: Greatest among three numbers.
-elif(question_no == 31):
-    print("31. Greatest among three numbers.")
-    while True:
-        try:
-            a = int(input("Enter first number (a): "))
-            b = int(input("Enter second number (b): "))
-            c = int(input("Enter third number (c): "))
-            break
-        except ValueError:
-            print("Invalid input. Please enter a valid integer.")
+        print(f"Checking if {num} is a Strong number:")
+        if is_strong(num):
+            print(f"{num} is a Strong number.")
+        else:
+            print(f"{num} is not a Strong number.")
 
-    if a > b and a > c:
-        print(f"{a} is greatest")
-    elif b > a and b > c:
-        print(f"{b} is greatest")
-    else:
-        print(f"{c} is greatest")
 
-#32: Sum of digits of all numbers entered becomes > 100.
-elif(question_no == 32):
-    print("32. Keep entering numbers until the sum of digits of all numbers entered is > 100.")
-    total_digit_sum = 0
-    num_count = 0
-    while total_digit_sum <= 100:
+    #31: Greatest among three numbers.
+    elif(question_no == 31):
+        print("31. Greatest among three numbers.")
         while True:
             try:
-                num = int(input(f"Enter number #{num_count + 1}: "))
+                a = int(input("Enter first number (a): "))
+                b = int(input("Enter second number (b): "))
+                c = int(input("Enter third number (c): "))
                 break
             except ValueError:
                 print("Invalid input. Please enter a valid integer.")
-        
-        current_digit_sum = 0
-        temp_num = abs(num)
-        while temp_num > 0:
-            current_digit_sum += temp_num % 10
-            temp_num //= 10
-        
-        total_digit_sum += current_digit_sum
-        num_count += 1
-        print(f"Current sum of digits: {total_digit_sum}")
 
-    print(f"The sum of digits exceeded 100 after {num_count} numbers.")
+        print(f"{greatest_of_three(a, b, c)} is greatest")
 
-
-#33: Duck number checker.
-elif(question_no == 33):
-    print("33. Duck number checker.")
-    while True:
-        num_str = input("Enter a number to check if it's a Duck number: ")
-        if num_str.startswith('0'):
-            print("Invalid input. A Duck number cannot start with zero. Please try again.")
-        else:
-            is_duck = False
-            i = 0
-            while i < len(num_str):
-                if num_str[i] == '0':
-                    is_duck = True
+    #32: Sum of digits of all numbers entered becomes > 100.
+    elif(question_no == 32):
+        print("32. Keep entering numbers until the sum of digits of all numbers entered is > 100.")
+        total_digit_sum = 0
+        num_count = 0
+        while total_digit_sum <= 100:
+            while True:
+                try:
+                    current_digit_sum = number_digit_sum(input(f"Enter number #{num_count + 1}: "))
                     break
-                i += 1
-            
-            if is_duck:
-                print(f"{num_str} is a Duck number.")
+                except ValueError:
+                    print("Invalid input. Please enter a valid integer.")
+
+            total_digit_sum += current_digit_sum
+            num_count += 1
+            print(f"Current sum of digits: {total_digit_sum}")
+
+        print(f"The sum of digits exceeded 100 after {num_count} numbers.")
+
+
+    #33: Duck number checker.
+    elif(question_no == 33):
+        print("33. Duck number checker.")
+        while True:
+            num_str = input("Enter a number to check if it's a Duck number: ")
+            if num_str.startswith('0'):
+                print("Invalid input. A Duck number cannot start with zero. Please try again.")
             else:
-                print(f"{num_str} is not a Duck number.")
-            break
+                if is_duck(num_str):
+                    print(f"{num_str} is a Duck number.")
+                else:
+                    print(f"{num_str} is not a Duck number.")
+                break
 
 
-#34: Happy number checker.
-elif(question_no == 34):
-    num = int(input("Enter a number to check if it's a Happy number: "))
-
-    seen = set()
-    original_num = num
-    while num != 1 and num not in seen:
-        seen.add(num)
-        
-        sum_of_squares = 0
-        temp_num = num
-        while temp_num > 0:
-            digit = temp_num % 10
-            sum_of_squares += digit ** 2
-            temp_num //= 10
-        
-        num = sum_of_squares
-
-    if num == 1:
-        print(f"{original_num} is a Happy number.")
-    else:
-        print(f"{original_num} is not a Happy number.")
+    #34: Happy number checker.
+    elif(question_no == 34):
+        num = int(input("Enter a number to check if it's a Happy number: "))
 
+        if is_happy(num):
+            print(f"{num} is a Happy number.")
+        else:
+            print(f"{num} is not a Happy number.")
 
-#35: Largest prime factor.
-elif(question_no == 35):
-    print("35. Largest prime factor.")
-    while True:
-        try:
-            n = int(input("Enter a number to find its largest prime factor: "))
-            break
-        except ValueError:
-            print("Invalid input. Please enter a valid integer.")
 
-    largest_prime = -1
-    i = 2
-    while i * i <= n:
-        while n % i == 0:
-            largest_prime = i
-            n //= i
-        i += 1
+    #35: Largest prime factor.
+    elif(question_no == 35):
+        print("35. Largest prime factor.")
+        while True:
+            try:
+                n = int(input("Enter a number to find its largest prime factor: "))
+                break
+            except ValueError:
+                print("Invalid input. Please enter a valid integer.")
 
-    if n > 1:
-        largest_prime = n
+        print(f"The largest prime factor is: {largest_prime_factor(n)}")
 
-    print(f"The largest prime factor is: {largest_prime}")
 
+    #36: Palindrome string.
+    elif(question_no == 36):
+        print("36. Palindrome string checker.")
+        while True:
+            s = input("Enter a string: ")
+            if is_palindrome(s):
+                print(f"'{s}' is a palindrome. Exiting.")
+                break
+            else:
+                print(f"'{s}' is not a palindrome. Please try again.")
 
-#36: Palindrome string.
-elif(question_no == 36):
-    print("36. Palindrome string checker.")
-    while True:
-        s = input("Enter a string: ")
-        reversed_s = s[::-1]
-        if s == reversed_s:
-            print(f"'{s}' is a palindrome. Exiting.")
-            break
-        else:
-            print(f"'{s}' is not a palindrome. Please try again.")
+    #37: Digital root.
+    elif(question_no == 37):
+        print("37. Digital root.")
+        while True:
+            try:
+                root = digital_root(input("Enter a number to find its digital root: "))
+                break
+            except ValueError:
+                print("Invalid input. Please enter a non-negative integer.")
 
-#37: Digital root.
-elif(question_no == 37):
-    print("37. Digital root.")
-    num = int(input("Enter a number to find its digital root: "))
-    while num >= 10:
-        sum_of_digits = 0
-        temp_num = num
-        while temp_num > 0:
-            sum_of_digits += temp_num % 10
-            temp_num //= 10
-        num = sum_of_digits
+        print(f"The digital root is: {root}")
 
-    print(f"The digital root is: {num}")
 
+    #38: Collatz sequence.
+    elif(question_no == 38):
+        print("38. Collatz sequence.")
+        n = int(input("Enter a starting number for the Collatz sequence: "))
 
-#38: Collatz sequence.
-elif(question_no == 38):
-    print("38. Collatz sequence.")
-    n = int(input("Enter a starting number for the Collatz sequence: "))
+        print("Collatz sequence:")
+        for value in collatz_trajectory(n):
+            sys.stdout.write(f"{value} ")
+        sys.stdout.write("\n")
 
-    sequence = [n]
-    while n != 1:
-        if n % 2 == 0:
-            n //= 2
+    #39: Kaprekar number checker.
+    elif(question_no == 39):
+        print("39. Kaprekar number checker.")
+        n = int(input("Enter a number to check if it's a Kaprekar number: "))
+        if is_kaprekar(n):
+            print(f"{n} is a Kaprekar number.")
         else:
-            n = 3 * n + 1
-        sequence.append(n)
-
-    print("Collatz sequence:")
-    print(sequence)
-
-#39: Kaprekar number checker.
-elif(question_no == 39):
-    print("39. Kaprekar number checker.")
-    n = int(input("Enter a number to check if it's a Kaprekar number: "))
-    is_kaprekar = False
-    if n > 0:
-        square = n * n
-        s_square = str(square)
-        length = len(s_square)
-        
-        i = 1
-        while i < length:
-            part1 = int(s_square[:i])
-            part2 = int(s_square[i:])
-            if part2 != 0 and part1 + part2 == n:
-                is_kaprekar = True
-                break
-            i += 1
-
-    if is_kaprekar:
-        print(f"{n} is a Kaprekar number.")
-    else:
-        print(f"{n} is not a Kaprekar number.")
+            print(f"{n} is not a Kaprekar number.")
 
 
-#40: ATM machine simulation.
-elif(question_no == 40):
-    print("40. ATM machine simulation.")
-    balance = 1000.00
-    while True:
-        print("\nATM Menu:")
-        print("1. Check Balance")
-        print("2. Deposit Money")
-        print("3. Withdraw Money")
-        print("4. Exit")
-        
-        choice = input("Enter your choice (1-4): ")
-        
-        if choice == '1':
-            print(f"Your current balance is: ${balance:.2f}")
-        elif choice == '2':
-            while True:
-                try:
-                    deposit_amount = float(input("Enter amount to deposit: $"))
-                    if deposit_amount > 0:
-                        balance += deposit_amount
-                        print(f"Successfully deposited ${deposit_amount:.2f}. New balance: ${balance:.2f}")
-                        break
-                    else:
-                        print("Deposit amount must be positive.")
-                except ValueError:
-                    print("Invalid input. Please enter a valid amount.")
-        elif choice == '3':
-            while True:
-                try:
-                    withdraw_amount = float(input("Enter amount to withdraw: $"))
-                    if withdraw_amount > 0:
-                        if balance >= withdraw_amount:
-                            balance -= withdraw_amount
-                            print(f"Successfully withdrew ${withdraw_amount:.2f}. New balance: ${balance:.2f}")
-                            break
+    #40: ATM machine simulation.
+    elif(question_no == 40):
+        print("40. ATM machine simulation.")
+        ledger = Ledger(atm_ledger_dir, opening_balance=atm_opening_balance)
+        account = input("Enter your account number: ").strip() or "default"
+        while True:
+            print("\nATM Menu:")
+            print("1. Check Balance")
+            print("2. Deposit Money")
+            print("3. Withdraw Money")
+            print("4. Exit")
+
+            choice = input("Enter your choice (1-4): ")
+
+            if choice == '1':
+                print(f"Your current balance is: ${format_cents(ledger.balance(account))}")
+            elif choice in ('2', '3'):
+                action = "deposit" if choice == '2' else "withdraw"
+                while True:
+                    try:
+                        cents = to_cents(input(f"Enter amount to {action}: $"))
+                        if choice == '2':
+                            balance = ledger.deposit(account, cents)
+                            print(f"Successfully deposited ${format_cents(cents)}. New balance: ${format_cents(balance)}")
                         else:
-                            print("Insufficient balance.")
+                            balance = ledger.withdraw(account, cents)
+                            print(f"Successfully withdrew ${format_cents(cents)}. New balance: ${format_cents(balance)}")
+                        break
+                    except ValueError as e:
+                        print(e)
+                        if str(e) == "Insufficient balance.":
                             break
-                    else:
-                        print("Withdrawal amount must be positive.")
-                except ValueError:
-                    print("Invalid input. Please enter a valid amount.")
-        elif choice == '4':
-            print("Thank you for using the ATM. Goodbye!")
-            break
-        else:
-            print("Invalid choice. Please enter a number from 1 to 4.")
-    print("-" * 30)
-else:
-    print("Entered question no. does not exist")
+            elif choice == '4':
+                print("Thank you for using the ATM. Goodbye!")
+                break
+            else:
+                print("Invalid choice. Please enter a number from 1 to 4.")
+        ledger.close()
+        print("-" * 30)
+    else:
+        print("Entered question no. does not exist")
 
 
+# ---------------------------------------------------------------------------
+# benchmarks (run with --bench NAME)
+# ---------------------------------------------------------------------------
 
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
 
 
+# the old question 26 loop: trial division of num and num + 2
+def twin_primes_trial_division(a, b):
+    def is_prime(num):
+        if num <= 1:
+            return False
+        for i in range(2, int(num**0.5) + 1):
+            if num % i == 0:
+                return False
+        return True
+
+    return [(num, num + 2) for num in range(a, b - 1) if is_prime(num) and is_prime(num + 2)]
+
+
+def bench_twin_primes():
+    print(f"{'range':>12} {'trial division':>16} {'sieve':>10}")
+    for size in (10**3, 10**4, 10**5, 10**6):
+        old = timed(twin_primes_trial_division, 1, size)
+        new = timed(lambda a, b: list(twin_primes_between(a, b)), 1, size)
+        print(f"{size:>12} {old:>15.4f}s {new:>9.4f}s")
+
+
+# load generator for the ledger: `threads` clients hammer random accounts
+# with deposits and withdrawals against a ledger in a temporary directory
+def bench_atm(threads=64, ops_per_thread=500, accounts=1000):
+    import random
+    import tempfile
+    import threading
+    with tempfile.TemporaryDirectory() as directory:
+        ledger = Ledger(directory, opening_balance=atm_opening_balance)
+        latencies = []
+
+        def client(seed):
+            rng = random.Random(seed)
+            mine = []
+            for _ in range(ops_per_thread):
+                account = rng.randrange(accounts)
+                start = time.perf_counter()
+                try:
+                    if rng.random() < 0.5:
+                        ledger.deposit(account, rng.randrange(1, 10000))
+                    else:
+                        ledger.withdraw(account, rng.randrange(1, 10000))
+                except ValueError:
+                    pass
+                mine.append(time.perf_counter() - start)
+            latencies.extend(mine)
+
+        start = time.perf_counter()
+        workers = [threading.Thread(target=client, args=(i,)) for i in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        ledger.close()
+    latencies.sort()
+    print(f"{len(latencies)} operations from {threads} threads in {elapsed:.2f}s")
+    print(f"throughput: {len(latencies) / elapsed:.0f} ops/s")
+    print(f"latency p50: {latencies[len(latencies) // 2] * 1000:.2f} ms  "
+          f"p99: {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+
+
+# palindromic files of 1 KB, 1 MB and 1 GB: reading the whole file and
+# comparing it with its reversed copy against the chunked mmap check
+def bench_palindrome(sizes=(1 << 10, 1 << 20, 1 << 30)):
+    import random
+    import tempfile
+    print(f"{'size':>12} {'slice':>10} {'mmap':>10}")
+    for size in sizes:
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            path = f.name
+            half = size // 2
+            blocks = range(0, half, 1 << 20)
+            for start in blocks:
+                f.write(random.Random(start).randbytes(min(1 << 20, half - start)))
+            for start in reversed(blocks):
+                f.write(random.Random(start).randbytes(min(1 << 20, half - start))[::-1])
+        try:
+            def sliced():
+                with open(path, "rb") as f:
+                    data = f.read()
+                return data == data[::-1]
 
+            old = timed(sliced)
+            new = timed(is_palindrome_file, path)
+            print(f"{size:>12} {old:>9.4f}s {new:>9.4f}s")
+        finally:
+            os.remove(path)
 
 
+# the old question 29 loop
+def sum_of_squares_loop(n):
+    total_sum = 0
+    for i in range(1, n + 1):
+        total_sum += i ** 2
+    return total_sum
 
 
+def bench_series():
+    import random
+    print(f"{'n':>16} {'loop':>10} {'closed form':>12}")
+    for n in (10**3, 10**5, 10**7, 10**12, 10**100):
+        old = f"{timed(sum_of_squares_loop, n):.4f}s" if n <= 10**7 else "-"
+        new = timed(power_sum, n, 2)
+        print(f"{n:>16.0e} {old:>10} {new:>11.6f}s")
+    pairs = [(random.randrange(10**12), random.randrange(1, 20)) for _ in range(10**5)]
+    print(f"{len(pairs)} random (n, k) pairs, k < 20: {timed(power_sums, pairs):.4f}s")
 
 
+# the service and the load generator in one process, on a free port
+def bench_serve(connections=32, requests=2000):
+    import asyncio
 
+    async def run():
+        started = asyncio.get_running_loop().create_future()
+        server = asyncio.create_task(serve(serve_host, 0, started=started))
+        host, port = await started
+        try:
+            return await load(host, port, connections, requests)
+        finally:
+            server.cancel()
+
+    print_load_report(asyncio.run(run()), connections)
+
+
+benchmarks = {
+    "twin": bench_twin_primes,
+    "serve": bench_serve,
+    "series": bench_series,
+    "atm": bench_atm,
+    "palindrome": bench_palindrome,
+}
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="assignment 1 question solvers")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="run {question, args} records from a JSONL/CSV file ('-' for stdin)")
+    parser.add_argument("--format", choices=["jsonl", "csv"],
+                        help="format of the batch input (default: from the file extension)")
+    parser.add_argument("--bench", choices=sorted(benchmarks),
+                        help="run a benchmark and exit")
+    parser.add_argument("--classify", nargs=2, metavar=("BAND", "FILE"),
+                        help="label the first column of a CSV file with a band ("
+                             + ", ".join(bands) + "); the histogram goes to stderr")
+    parser.add_argument("--scan", metavar="FILE",
+                        help="pangram status and character counts of a text file")
+    parser.add_argument("--digit-sum", metavar="FILE",
+                        help="digit sum and digital root of the integers in a file ('-' for stdin)")
+    parser.add_argument("--duck", metavar="FILE",
+                        help="print the duck numbers of a file with one number per line")
+    parser.add_argument("--kind", choices=sorted(duck_patterns), default="duck",
+                        help="with --duck, which numbers to pick (default: duck)")
+    parser.add_argument("--count", action="store_true",
+                        help="with --duck or --range-scan, print only how many numbers match")
+    parser.add_argument("--select", metavar="FILE",
+                        help="min, max and the k largest/smallest values of a .csv, binary int64 file or '-' for stdin")
+    parser.add_argument("-k", type=int, default=1,
+                        help="with --select, how many largest and smallest values to keep (default: 1)")
+    parser.add_argument("--calendar", metavar="FILE",
+                        help="count leap, century and century-leap years in a .csv or binary int64 file")
+    parser.add_argument("--bill", metavar="FILE",
+                        help="electricity bill of every reading in a .csv, binary int64 file or '-' for stdin")
+    parser.add_argument("--column", type=int, default=0,
+                        help="with --calendar or --bill, the CSV column to read (default: 0)")
+    parser.add_argument("--serve", metavar="[HOST:]PORT",
+                        help="answer questions over HTTP/JSON (POST {question, args})")
+    parser.add_argument("--load", metavar="[HOST:]PORT",
+                        help="run the load generator against a running --serve")
+    parser.add_argument("--workers", type=int,
+                        help="with --serve or --range-scan, worker processes (default: CPU count)")
+    parser.add_argument("--connections", type=int, default=32,
+                        help="with --load, concurrent keep-alive connections (default: 32)")
+    parser.add_argument("--requests", type=int, default=2000,
+                        help="with --load, total requests to send (default: 2000)")
+    parser.add_argument("--cache", metavar="PATH",
+                        help="with --batch or --serve, cache the answers of questions "
+                             + ", ".join(map(str, sorted(cached_questions))) + " in an SQLite file")
+    parser.add_argument("--cache-ttl", type=float, metavar="SECONDS",
+                        help="with --cache or --warm-cache, how long a cached answer stays valid")
+    parser.add_argument("--warm-cache", metavar="FILE",
+                        help="fill the cache (--cache, default " + result_cache_path
+                             + ") from a batch file of hot inputs")
+    parser.add_argument("--range-scan", nargs=3, type=int, metavar=("QUESTION", "A", "B"),
+                        help="numbers in [A, B] with the property of question "
+                             + ", ".join(map(str, sorted(range_kernels))) + " (one per line)")
+    parser.add_argument("--unordered", action="store_true",
+                        help="with --range-scan, print chunks as they finish instead of in order")
+    parser.add_argument("--checkpoint", metavar="PATH",
+                        help="with --range-scan, save progress to PATH and resume from it")
+    parser.add_argument("--per-line", action="store_true",
+                        help="with --scan or --digit-sum, report every line separately")
+    options = parser.parse_args()
+    if options.cache and not options.warm_cache:
+        enable_result_cache(options.cache, options.cache_ttl)
+    if options.bench:
+        benchmarks[options.bench]()
+    elif options.classify:
+        classify_main(*options.classify)
+    elif options.scan:
+        scan_main(options.scan, options.per_line)
+    elif options.digit_sum:
+        digit_sum_main(options.digit_sum, options.per_line)
+    elif options.duck:
+        duck_main(options.duck, options.kind, options.count)
+    elif options.select:
+        select_main(options.select, options.k)
+    elif options.calendar:
+        calendar_main(options.calendar, options.column)
+    elif options.bill:
+        bill_main(options.bill, options.column)
+    elif options.serve:
+        serve_main(options.serve, options.workers)
+    elif options.load:
+        load_main(options.load, options.connections, options.requests)
+    elif options.range_scan:
+        range_scan_main(*options.range_scan, options.count, not options.unordered, options.workers,
+                        options.checkpoint)
+    elif options.warm_cache:
+        warm_cache_main(options.warm_cache, options.format, options.cache, options.cache_ttl)
+    elif options.batch:
+        batch_main(options.batch, options.format)
+    else:
+        interactive()
+    disable_result_cache()
 
 
-    
+if __name__ == "__main__":
+    main()
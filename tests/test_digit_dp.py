@@ -0,0 +1,44 @@
+# the digit DP engine against the per-number loops it replaced, on random
+# ranges (fixed seeds, so a failure can be reproduced)
+import importlib.util
+import pathlib
+import random
+
+import pytest
+
+script = pathlib.Path(__file__).resolve().parent.parent / "assignment 1.py"
+spec = importlib.util.spec_from_file_location("assignment", script)
+assignment = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(assignment)
+
+
+def random_range(rng):
+    a = rng.randrange(0, 10 ** rng.randint(1, 5))
+    return a, a + rng.randrange(0, 3000)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_digit_numbers_match_loop(seed):
+    rng = random.Random(seed)
+    a, b = random_range(rng)
+    modulus = rng.randint(1, 13)
+    min_sum = rng.randint(0, 20)
+    max_sum = rng.choice([None, min_sum + rng.randint(0, 20)])
+    expected = assignment.digit_numbers_loop(a, b, modulus, min_sum, max_sum)
+    assert list(assignment.iter_digit_numbers(a, b, modulus, min_sum, max_sum)) == expected
+    assert assignment.count_digit_numbers_between(a, b, modulus, min_sum, max_sum) == len(expected)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_harshad_match_loop(seed):
+    rng = random.Random(seed)
+    a, b = random_range(rng)
+    expected = assignment.harshad_loop(a, b)
+    assert list(assignment.iter_harshad(a, b)) == expected
+    assert assignment.count_harshad(b) - assignment.count_harshad(max(a, 1) - 1) == len(expected)
+
+
+def test_empty_and_edge_ranges():
+    for a, b in [(0, 0), (5, 4), (9, 10), (99, 101), (999, 1000)]:
+        assert list(assignment.iter_digit_numbers(a, b, 3, 0, 10)) == assignment.digit_numbers_loop(a, b, 3, 0, 10)
+        assert list(assignment.iter_harshad(a, b)) == assignment.harshad_loop(a, b)
@@ -0,0 +1,43 @@
+# importing the script must stay cheap: nothing runs but the module-level
+# imports and constants, and the heavy stdlib modules are only imported by
+# the functions that use them. each check runs in a fresh interpreter, since
+# pytest itself has most of these modules loaded already.
+import pathlib
+import subprocess
+import sys
+
+script = pathlib.Path(__file__).resolve().parent.parent / "assignment 1.py"
+import_budget = 0.015    # seconds for the module-level code (~3 ms measured)
+import_tries = 5         # fresh interpreters; the fastest one is compared
+lazy_modules = ("json", "asyncio", "sqlite3", "concurrent.futures")
+
+# compiling the 3000-line source is left out of the timing: it depends on
+# whether a .pyc is around, not on what the import does
+probe = """
+import importlib.util, sys, time
+spec = importlib.util.spec_from_file_location("assignment", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+code = spec.loader.get_code(spec.name)
+start = time.perf_counter()
+exec(code, module.__dict__)
+print(time.perf_counter() - start)
+print(" ".join(name for name in sys.argv[2:] if name in sys.modules))
+"""
+
+
+def run_probe():
+    output = subprocess.run(
+        [sys.executable, "-c", probe, str(script), *lazy_modules],
+        capture_output=True, text=True, check=True, timeout=60,
+    ).stdout.splitlines()
+    return float(output[0]), output[1].split() if len(output) > 1 else []
+
+
+def test_import_is_fast():
+    elapsed = min(run_probe()[0] for _ in range(import_tries))
+    assert elapsed < import_budget
+
+
+def test_import_leaves_heavy_modules_unloaded():
+    _, loaded = run_probe()
+    assert loaded == []
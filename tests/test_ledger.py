@@ -0,0 +1,56 @@
+# the ATM ledger's write-ahead log: what a restart recovers
+import importlib.util
+import os
+import pathlib
+
+script = pathlib.Path(__file__).resolve().parent.parent / "assignment 1.py"
+spec = importlib.util.spec_from_file_location("assignment", script)
+assignment = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(assignment)
+
+
+def reopen(directory, **options):
+    return assignment.Ledger(str(directory), opening_balance=0, **options)
+
+
+def test_changes_survive_a_restart(tmp_path):
+    ledger = reopen(tmp_path)
+    ledger.deposit("a", 100)
+    ledger.withdraw("a", 30)
+    ledger.deposit("b", 5)
+    ledger.close()
+    ledger = reopen(tmp_path)
+    assert (ledger.balance("a"), ledger.balance("b")) == (70, 5)
+    ledger.close()
+
+
+def test_torn_tail_is_cut_before_new_records(tmp_path):
+    ledger = reopen(tmp_path)
+    ledger.deposit("a", 100)
+    ledger.close()
+    with open(tmp_path / "wal.log", "a", encoding="utf-8") as f:
+        f.write("2 a 50 15")            # a write cut short by a crash
+    ledger = reopen(tmp_path)
+    assert ledger.balance("a") == 100
+    assert ledger.deposit("a", 7) == 107
+    assert ledger.deposit("b", 9) == 9
+    ledger.close()
+    ledger = reopen(tmp_path)
+    assert (ledger.balance("a"), ledger.balance("b")) == (107, 9)
+    ledger.close()
+
+
+def test_snapshot_then_replay(tmp_path):
+    ledger = reopen(tmp_path, snapshot_every=3)
+    for cents in range(1, 8):
+        ledger.deposit("a", cents)
+    ledger.withdraw("a", 10)
+    ledger.close()
+    assert os.path.exists(tmp_path / "snapshot.json")
+    ledger = reopen(tmp_path, snapshot_every=3)
+    assert ledger.balance("a") == sum(range(1, 8)) - 10
+    ledger.deposit("a", 1)
+    ledger.close()
+    ledger = reopen(tmp_path)
+    assert ledger.balance("a") == sum(range(1, 8)) - 9
+    ledger.close()
@@ -0,0 +1,40 @@
+# range scans stopped part way and resumed from their checkpoint
+import importlib.util
+import itertools
+import pathlib
+
+script = pathlib.Path(__file__).resolve().parent.parent / "assignment 1.py"
+spec = importlib.util.spec_from_file_location("assignment", script)
+assignment = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(assignment)
+
+happy = 34
+top = 10 ** 6
+
+
+def test_stopped_scan_resumes_without_repeats(tmp_path):
+    checkpoint = str(tmp_path / "scan.json")
+    expected = list(assignment.scan_question(happy, 1, top, workers=1))
+    scan = assignment.scan_question_chunks(happy, 1, top, workers=1, checkpoint=checkpoint)
+    found = []
+    for lo, hi, matches in itertools.islice(scan, 11):
+        found += matches
+    scan.close()
+    found += assignment.scan_question(happy, 1, top, workers=1, checkpoint=checkpoint)
+    assert found == expected
+
+
+def test_cancelled_count_resumes_to_the_full_total(tmp_path):
+    import threading
+    checkpoint = str(tmp_path / "count.json")
+    expected = assignment.scan_question(happy, 1, top, True, workers=1)
+    cancel = threading.Event()
+    kernel = assignment.range_kernels[happy][0]
+    scan = assignment.range_scan(kernel, 1, top, True, workers=1, chunk_size=1 << 16,
+                                 cancel=cancel, checkpoint=checkpoint)
+    for _ in itertools.islice(scan, 5):
+        pass
+    cancel.set()
+    scan.close()
+    total = assignment.scan_count(kernel, 1, top, workers=1, chunk_size=1 << 16, checkpoint=checkpoint)
+    assert total == expected
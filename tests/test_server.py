@@ -0,0 +1,51 @@
+# the HTTP/JSON service: a slow request must not hold up a fast one
+import asyncio
+import importlib.util
+import json
+import pathlib
+import sys
+import time
+
+script = pathlib.Path(__file__).resolve().parent.parent / "assignment 1.py"
+spec = importlib.util.spec_from_file_location("assignment", script)
+assignment = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = assignment     # the pool workers look functions up by module
+spec.loader.exec_module(assignment)
+
+
+async def post(host, port, payload):
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode()
+    writer.write(b"POST / HTTP/1.1\r\nContent-Length: %d\r\nConnection: close\r\n\r\n" % len(body) + body)
+    await writer.drain()
+    response = await asyncio.wait_for(reader.read(), 60)
+    writer.close()
+    return json.loads(response.partition(b"\r\n\r\n")[2])
+
+
+async def slow_and_fast_clients():
+    started = asyncio.get_running_loop().create_future()
+    server = asyncio.create_task(assignment.serve("127.0.0.1", 0, workers=1, started=started))
+    host, port = await started
+    try:
+        # q29 with a large power builds Bernoulli numbers: seconds of work
+        slow = asyncio.create_task(post(host, port, {"question": 29, "args": [10, 600]}))
+        await asyncio.sleep(0.2)
+        start = time.perf_counter()
+        fast = await post(host, port, {"question": 1, "args": [5]})
+        fast_time = time.perf_counter() - start
+        return fast, fast_time, slow.done(), await slow
+    finally:
+        server.cancel()
+        try:
+            await server
+        except asyncio.CancelledError:
+            pass
+
+
+def test_fast_request_is_not_blocked_by_a_slow_one():
+    fast, fast_time, slow_done_first, slow = asyncio.run(slow_and_fast_clients())
+    assert fast == {"question": 1, "result": "positive"}
+    assert fast_time < 1.0
+    assert not slow_done_first
+    assert slow["question"] == 29 and "result" in slow
@@ -0,0 +1,28 @@
+# bulk billing (the tariff table) against the one-reading slab_bill
+import importlib.util
+import pathlib
+import random
+from array import array
+
+import pytest
+
+script = pathlib.Path(__file__).resolve().parent.parent / "assignment 1.py"
+spec = importlib.util.spec_from_file_location("assignment", script)
+assignment = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(assignment)
+
+tariffs = [
+    assignment.default_tariff,
+    ((100, 0.1), (200, 0.7), (None, 1.3)),
+    ((50, 1.15), (None, 2.35)),
+    ((10, 3),),
+]
+
+
+@pytest.mark.parametrize("tariff", tariffs)
+def test_bulk_bills_equal_slab_bill(tariff):
+    rng = random.Random(0)
+    readings = array("q", [0, 1, 100, 200, 201, assignment.tariff_table_size - 1, assignment.tariff_table_size])
+    readings.extend(rng.randrange(0, 2 * assignment.tariff_table_size) for _ in range(2000))
+    bills = assignment.bills(readings, tariff)
+    assert list(bills) == [assignment.slab_bill(units, tariff) for units in readings]